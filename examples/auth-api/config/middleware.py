@@ -8,15 +8,10 @@ from fastapi.middleware.cors import CORSMiddleware
 
 try:
     from starlette.middleware.base import BaseHTTPMiddleware
-except ImportError:
+except ModuleNotFoundError:
     from fastapi.middleware.base import BaseHTTPMiddleware
 
-try:
-    from .settings import get_settings
-except ImportError:
-    print("Configuration error: settings module not available")
-    print("Please install required dependencies: pip install -r requirements.txt")
-    raise
+from .settings import get_settings
 
 
 class TimingMiddleware(BaseHTTPMiddleware):
@@ -1,20 +1,20 @@
 """Main FastAPI application for auth-api."""
 
 import hashlib
-from datetime import datetime, timedelta
+import hmac
+import time
+from datetime import timedelta
+from functools import lru_cache
 
 import jwt
-from fastapi import Depends, FastAPI, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+import orjson
+from fastapi import FastAPI, HTTPException, Response, Security, status
+from fastapi.responses import ORJSONResponse
+from fastapi.security import OAuth2PasswordBearer
 
-try:
-    from config.middleware import setup_middleware
-    from config.settings import get_settings
-    from routers import base_router
-except ImportError as e:
-    print(f"Configuration error: {e}")
-    print("Please install required dependencies: pip install -r requirements.txt")
-    raise
+from config.middleware import setup_middleware
+from config.settings import get_settings
+from routers import base_router
 
 # Get application settings
 settings = get_settings()
@@ -25,6 +25,7 @@ app = FastAPI(
     description="A FastAPI project generated with FasCraft - Auth API Example",
     version=settings.app_version,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
 )
 
 # Setup middleware
@@ -37,8 +38,28 @@ except Exception as e:
 # Include base router (all module routers are included here)
 app.include_router(base_router)
 
-# Security
-security = HTTPBearer()
+# Security: the bearer token arrives as a plain string, no credentials model
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+
+# JWT configuration (in production, use environment variables)
+SECRET_KEY = "your-secret-key-change-in-production"
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 30
+
+# Key material encoded once rather than on every encode/decode call
+SECRET_KEY_BYTES = SECRET_KEY.encode()
+
+# Key for the password hash; BLAKE2b accepts at most 64 bytes of key
+PASSWORD_HASH_KEY = SECRET_KEY_BYTES[:64]
+
+
+@lru_cache(maxsize=1024)
+def hash_password(password: str) -> bytes:
+    """Hash a password with keyed BLAKE2b, memoizing repeat attempts."""
+    return hashlib.blake2b(
+        password.encode(), key=PASSWORD_HASH_KEY, digest_size=32
+    ).digest()
+
 
 # Sample data for demonstration (in production, use a real database)
 users = [
@@ -46,7 +67,7 @@ users = [
         "id": 1,
         "username": "admin",
         "email": "admin@example.com",
-        "hashed_password": hashlib.sha256(b"admin123").hexdigest(),
+        "hashed_password": hash_password("admin123"),
         "is_active": True,
         "role": "admin",
     },
@@ -54,44 +75,70 @@ users = [
         "id": 2,
         "username": "user1",
         "email": "user1@example.com",
-        "hashed_password": hashlib.sha256(b"user123").hexdigest(),
+        "hashed_password": hash_password("user123"),
         "is_active": True,
         "role": "user",
     },
 ]
 
-# JWT configuration (in production, use environment variables)
-SECRET_KEY = "your-secret-key-change-in-production"
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
+# Lookup indexes so auth checks don't scan the user list
+users_by_name: dict[str, dict] = {u["username"]: u for u in users}
+users_by_email: dict[str, dict] = {u["email"]: u for u in users}
+
+# Serialized admin user listing, rebuilt after the next registration
+_public_users_cache: bytes | None = None
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     """Create JWT access token."""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    # PyJWT accepts exp as epoch seconds, which avoids datetime arithmetic
+    ttl = int(expires_delta.total_seconds()) if expires_delta else 15 * 60
+    to_encode["exp"] = int(time.time()) + ttl
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY_BYTES, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    """Verify JWT token."""
+# Decoded tokens, kept briefly so repeated requests skip signature checks
+TOKEN_CACHE_TTL_SECONDS = 30
+TOKEN_CACHE_MAX_SIZE = 4096
+_token_cache: dict[str, tuple[str | None, float]] = {}
+
+
+def _decode_cached(token: str) -> str | None:
+    """Decode a JWT and return its subject, reusing recent results."""
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        username, valid_until = cached
+        if valid_until > now:
+            return username
+        del _token_cache[token]
+
+    payload = jwt.decode(token, SECRET_KEY_BYTES, algorithms=[ALGORITHM])
+    username = payload.get("sub")
+    if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+        _token_cache.clear()
+    # Never trust a cached entry past the token's own expiry
+    _token_cache[token] = (
+        username,
+        min(payload["exp"], now + TOKEN_CACHE_TTL_SECONDS),
+    )
+    return username
+
+
+async def verify_token(token: str = Security(oauth2_scheme)) -> dict:
+    """Verify JWT token and return the user it was issued to."""
     try:
-        payload = jwt.decode(
-            credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM]
-        )
-        username: str = payload.get("sub")
-        if username is None:
+        username = _decode_cached(token)
+        user = users_by_name.get(username) if username is not None else None
+        if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        return username
+        return user
     except jwt.ExpiredSignatureError as err:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -106,24 +153,30 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
         ) from err
 
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {
+# Static payloads, serialized once at import
+ROOT_BODY = orjson.dumps(
+    {
         "message": f"Welcome to {settings.app_name} - Authentication API!",
         "status": "running",
     }
+)
+
+
+@app.get("/")
+async def root():
+    """Root endpoint."""
+    return Response(ROOT_BODY, media_type="application/json")
 
 
 @app.post("/api/auth/register")
 async def register_user(username: str, email: str, password: str):
     """Register a new user."""
     # Check if username already exists
-    if any(u["username"] == username for u in users):
+    if username in users_by_name:
         raise HTTPException(status_code=400, detail="Username already registered")
 
     # Check if email already exists
-    if any(u["email"] == email for u in users):
+    if email in users_by_email:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     # Create new user
@@ -131,11 +184,15 @@ async def register_user(username: str, email: str, password: str):
         "id": max(u["id"] for u in users) + 1,
         "username": username,
         "email": email,
-        "hashed_password": hashlib.sha256(password.encode()).hexdigest(),
+        "hashed_password": hash_password(password),
         "is_active": True,
         "role": "user",
     }
     users.append(new_user)
+    users_by_name[username] = new_user
+    users_by_email[email] = new_user
+    global _public_users_cache
+    _public_users_cache = None
 
     return {
         "message": "User registered successfully",
@@ -151,15 +208,15 @@ async def register_user(username: str, email: str, password: str):
 @app.post("/api/auth/login")
 async def login(username: str, password: str):
     """Login user and return access token."""
-    user = next((u for u in users if u["username"] == username), None)
+    user = users_by_name.get(username)
     if not user:
         raise HTTPException(status_code=400, detail="Invalid username or password")
 
     if not user["is_active"]:
         raise HTTPException(status_code=400, detail="User account is disabled")
 
-    hashed_password = hashlib.sha256(password.encode()).hexdigest()
-    if user["hashed_password"] != hashed_password:
+    hashed_password = hash_password(password)
+    if not hmac.compare_digest(user["hashed_password"], hashed_password):
         raise HTTPException(status_code=400, detail="Invalid username or password")
 
     # Create access token
@@ -183,12 +240,8 @@ async def login(username: str, password: str):
 
 
 @app.get("/api/auth/me")
-async def get_current_user(username: str = Depends(verify_token)):
+async def get_current_user(user: dict = Security(verify_token)):
     """Get current user information."""
-    user = next((u for u in users if u["username"] == username), None)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     return {
         "id": user["id"],
         "username": user["username"],
@@ -199,33 +252,33 @@ async def get_current_user(username: str = Depends(verify_token)):
 
 
 @app.get("/api/auth/users")
-async def get_users(current_user: str = Depends(verify_token)):
+async def get_users(current_user: dict = Security(verify_token)):
     """Get all users (admin only)."""
-    user = next((u for u in users if u["username"] == current_user), None)
-    if not user or user["role"] != "admin":
+    if current_user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
 
-    return {
-        "users": [
+    global _public_users_cache
+    if _public_users_cache is None:
+        _public_users_cache = orjson.dumps(
             {
-                "id": u["id"],
-                "username": u["username"],
-                "email": u["email"],
-                "role": u["role"],
-                "is_active": u["is_active"],
+                "users": [
+                    {
+                        "id": u["id"],
+                        "username": u["username"],
+                        "email": u["email"],
+                        "role": u["role"],
+                        "is_active": u["is_active"],
+                    }
+                    for u in users
+                ]
             }
-            for u in users
-        ]
-    }
+        )
+    return Response(_public_users_cache, media_type="application/json")
 
 
 @app.post("/api/auth/refresh")
-async def refresh_token(current_user: str = Depends(verify_token)):
+async def refresh_token(user: dict = Security(verify_token)):
     """Refresh access token."""
-    user = next((u for u in users if u["username"] == current_user), None)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     # Create new access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
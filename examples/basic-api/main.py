@@ -1,15 +1,12 @@
 """Main FastAPI application for basic-api."""
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 
-try:
-    from config.middleware import setup_middleware
-    from config.settings import get_settings
-    from routers import base_router
-except ImportError as e:
-    print(f"Configuration error: {e}")
-    print("Please install required dependencies: pip install -r requirements.txt")
-    raise
+from config.middleware import setup_middleware
+from config.settings import get_settings
+from routers import base_router
 
 # Get application settings
 settings = get_settings()
@@ -20,6 +17,7 @@ app = FastAPI(
     description="A FastAPI project generated with FasCraft - Basic API Example",
     version=settings.app_version,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
 )
 
 # Setup middleware
@@ -33,22 +31,31 @@ except Exception as e:
 app.include_router(base_router)
 
 
+# Static payloads, serialized once at import
+ROOT_BODY = orjson.dumps(
+    {"message": f"Hello from {settings.app_name}!", "status": "running"}
+)
+ITEMS_BODY = orjson.dumps(
+    {
+        "items": [
+            {"id": 1, "name": "Sample Item 1", "description": "A basic item"},
+            {"id": 2, "name": "Sample Item 2", "description": "Another basic item"},
+            {"id": 3, "name": "Sample Item 3", "description": "Yet another item"},
+        ]
+    }
+)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
-    return {"message": f"Hello from {settings.app_name}!", "status": "running"}
+    return Response(ROOT_BODY, media_type="application/json")
 
 
 @app.get("/api/items")
 async def get_items():
     """Get a list of sample items."""
-    return {
-        "items": [
-            {"id": 1, "name": "Sample Item 1", "description": "A basic item"},
-            {"id": 2, "name": "Sample Item 2", "description": "Another basic item"},
-            {"id": 3, "name": "Sample Item 3", "description": "Yet another item"},
-        ]
-    }
+    return Response(ITEMS_BODY, media_type="application/json")
 
 
 @app.get("/api/items/{item_id}")
@@ -1,16 +1,9 @@
 """Application settings and configuration."""
 
-from functools import lru_cache
-
 try:
     from pydantic_settings import BaseSettings
-except ImportError:
-    try:
-        from pydantic import BaseSettings
-    except ImportError:
-        print("Configuration error: pydantic not available")
-        print("Please install required dependencies: pip install -r requirements.txt")
-        raise
+except ModuleNotFoundError:
+    from pydantic import BaseSettings
 
 
 class Settings(BaseSettings):
@@ -52,7 +45,10 @@ class Settings(BaseSettings):
                 return False
 
 
-@lru_cache
+# Built once at import; get_settings() hands out this shared instance
+SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the shared settings instance."""
+    return SETTINGS
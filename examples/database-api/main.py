@@ -1,30 +1,58 @@
 """Main FastAPI application for database-api."""
 
+import os
+from contextlib import asynccontextmanager
 from datetime import datetime
 
-from fastapi import Depends, FastAPI, HTTPException
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text, create_engine
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    lambda_stmt,
+    select,
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, sessionmaker
 
-try:
-    from config.middleware import setup_middleware
-    from config.settings import get_settings
-    from routers import base_router
-except ImportError as e:
-    print(f"Configuration error: {e}")
-    print("Please install required dependencies: pip install -r requirements.txt")
-    raise
+from config.middleware import setup_middleware
+from config.settings import get_settings
+from routers import base_router
 
 # Get application settings
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Optionally create tables on startup and dispose of the engine on shutdown."""
+    # Schema creation is opt-in; migrations own the schema everywhere else
+    if os.getenv("FASCRAFT_INIT_DB") == "1":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    yield
+    await engine.dispose()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.app_name,
     description="A FastAPI project generated with FasCraft - Database API Example",
     version=settings.app_version,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Setup middleware
@@ -38,11 +66,9 @@ except Exception as e:
 app.include_router(base_router)
 
 # Database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///./example.db"
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./example.db"
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 
@@ -60,6 +86,7 @@ class User(Base):
 
 class Product(Base):
     __tablename__ = "products"
+    __table_args__ = (Index("ix_products_cat_price", "category", "price"),)
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
@@ -77,54 +104,59 @@ class Order(Base):
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, index=True)
     total_amount = Column(Float)
-    status = Column(String, default="pending")
+    status = Column(String, default="pending", index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
-# Create tables
-Base.metadata.create_all(bind=engine)
-
-
 # Dependency to get database session
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {
+# Static payloads, serialized once at import
+ROOT_BODY = orjson.dumps(
+    {
         "message": f"Welcome to {settings.app_name} - Database Integration API!",
         "status": "running",
     }
+)
+
+
+@app.get("/")
+async def root():
+    """Root endpoint."""
+    return Response(ROOT_BODY, media_type="application/json")
 
 
 # User endpoints
 @app.post("/api/users")
 async def create_user(
-    username: str, email: str, full_name: str, db: Session = Depends(get_db)
+    username: str, email: str, full_name: str, db: AsyncSession = Depends(get_db)
 ):
     """Create a new user."""
     # Check if username already exists
-    existing_user = db.query(User).filter(User.username == username).first()
+    existing_user = (
+        await db.execute(
+            lambda_stmt(lambda: select(User).where(User.username == username))
+        )
+    ).scalar_one_or_none()
     if existing_user:
         raise HTTPException(status_code=400, detail="Username already registered")
 
     # Check if email already exists
-    existing_email = db.query(User).filter(User.email == email).first()
+    existing_email = (
+        await db.execute(lambda_stmt(lambda: select(User).where(User.email == email)))
+    ).scalar_one_or_none()
     if existing_email:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     # Create new user
     db_user = User(username=username, email=email, full_name=full_name)
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
 
     return {
         "message": "User created successfully",
@@ -139,9 +171,13 @@ async def create_user(
 
 
 @app.get("/api/users")
-async def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def get_users(
+    skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)
+):
     """Get all users with pagination."""
-    users = db.query(User).offset(skip).limit(limit).all()
+    stmt = select(User)
+    total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+    users = (await db.scalars(stmt.offset(skip).limit(limit))).all()
     return {
         "users": [
             {
@@ -153,16 +189,16 @@ async def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_d
             }
             for user in users
         ],
-        "total": len(users),
+        "total": total,
         "skip": skip,
         "limit": limit,
     }
 
 
 @app.get("/api/users/{user_id}")
-async def get_user(user_id: int, db: Session = Depends(get_db)):
+async def get_user(user_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific user by ID."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -184,7 +220,7 @@ async def create_product(
     price: float,
     category: str,
     stock_quantity: int = 0,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Create a new product."""
     db_product = Product(
@@ -195,8 +231,8 @@ async def create_product(
         stock_quantity=stock_quantity,
     )
     db.add(db_product)
-    db.commit()
-    db.refresh(db_product)
+    await db.commit()
+    await db.refresh(db_product)
 
     return {
         "message": "Product created successfully",
@@ -217,15 +253,23 @@ async def get_products(
     skip: int = 0,
     limit: int = 100,
     category: str | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Get all products with optional category filter and pagination."""
-    query = db.query(Product)
+    # Lambda statements cache the compiled SQL of this hot filtered listing
+    stmt = lambda_stmt(lambda: select(Product))
+    count_stmt = lambda_stmt(lambda: select(func.count()).select_from(Product))
 
     if category:
-        query = query.filter(Product.category == category)
+        stmt = stmt.add_criteria(lambda s: s.where(Product.category == category))
+        count_stmt = count_stmt.add_criteria(
+            lambda s: s.where(Product.category == category)
+        )
 
-    products = query.offset(skip).limit(limit).all()
+    total = await db.scalar(count_stmt)
+    products = (
+        await db.scalars(stmt.add_criteria(lambda s: s.offset(skip).limit(limit)))
+    ).all()
 
     return {
         "products": [
@@ -240,7 +284,7 @@ async def get_products(
             }
             for product in products
         ],
-        "total": len(products),
+        "total": total,
         "skip": skip,
         "limit": limit,
         "category": category,
@@ -248,9 +292,9 @@ async def get_products(
 
 
 @app.get("/api/products/{product_id}")
-async def get_product(product_id: int, db: Session = Depends(get_db)):
+async def get_product(product_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific product by ID."""
-    product = db.query(Product).filter(Product.id == product_id).first()
+    product = await db.get(Product, product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
 
@@ -272,18 +316,18 @@ async def create_order(
     user_id: int,
     total_amount: float,
     status: str = "pending",
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Create a new order."""
     # Check if user exists
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     db_order = Order(user_id=user_id, total_amount=total_amount, status=status)
     db.add(db_order)
-    db.commit()
-    db.refresh(db_order)
+    await db.commit()
+    await db.refresh(db_order)
 
     return {
         "message": "Order created successfully",
@@ -302,15 +346,16 @@ async def get_orders(
     skip: int = 0,
     limit: int = 100,
     user_id: int | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Get all orders with optional user filter and pagination."""
-    query = db.query(Order)
+    stmt = select(Order)
 
     if user_id:
-        query = query.filter(Order.user_id == user_id)
+        stmt = stmt.where(Order.user_id == user_id)
 
-    orders = query.offset(skip).limit(limit).all()
+    total = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+    orders = (await db.scalars(stmt.offset(skip).limit(limit))).all()
 
     return {
         "orders": [
@@ -323,7 +368,7 @@ async def get_orders(
             }
             for order in orders
         ],
-        "total": len(orders),
+        "total": total,
         "skip": skip,
         "limit": limit,
         "user_id": user_id,
@@ -331,9 +376,9 @@ async def get_orders(
 
 
 @app.get("/api/orders/{order_id}")
-async def get_order(order_id: int, db: Session = Depends(get_db)):
+async def get_order(order_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific order by ID."""
-    order = db.query(Order).filter(Order.id == order_id).first()
+    order = await db.get(Order, order_id)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
 
@@ -349,18 +394,29 @@ async def get_order(order_id: int, db: Session = Depends(get_db)):
 
 # Database statistics
 @app.get("/api/stats")
-async def get_database_stats(db: Session = Depends(get_db)):
+async def get_database_stats(db: AsyncSession = Depends(get_db)):
     """Get database statistics."""
-    user_count = db.query(User).count()
-    product_count = db.query(Product).count()
-    order_count = db.query(Order).count()
+    # Fetch all three table counts in a single round-trip
+    user_count, product_count, order_count = (
+        await db.execute(
+            select(
+                select(func.count(User.id)).scalar_subquery(),
+                select(func.count(Product.id)).scalar_subquery(),
+                select(func.count(Order.id)).scalar_subquery(),
+            )
+        )
+    ).one()
 
     # Get category distribution
-    categories = db.query(Product.category).distinct().all()
-    category_stats = {}
-    for category in categories:
-        count = db.query(Product).filter(Product.category == category[0]).count()
-        category_stats[category[0]] = count
+    category_stats = dict(
+        (
+            await db.execute(
+                select(Product.category, func.count(Product.id)).group_by(
+                    Product.category
+                )
+            )
+        ).all()
+    )
 
     return {
         "total_users": user_count,
@@ -376,8 +432,9 @@ async def get_database_stats(db: Session = Depends(get_db)):
 
 # Database setup note:
 # This example uses SQLite for simplicity
-# For production, consider using PostgreSQL or MySQL
-# The database file will be created automatically at ./example.db
+# For production, consider using PostgreSQL or MySQL and manage the schema
+# with Alembic migrations
+# Start with FASCRAFT_INIT_DB=1 to create the tables in ./example.db
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,58 +1,66 @@
-"""Application settings and configuration."""
+"""Application settings and configuration.
 
-from functools import lru_cache
+Settings are read from upper-case environment variables such as DATABASE_URL
+or CORS_ORIGINS, the names used in .env.sample. Values in a .env file are
+loaded first; variables already set in the environment take precedence.
+"""
 
-try:
-    from pydantic_settings import BaseSettings
-except ImportError:
-    try:
-        from pydantic import BaseSettings
-    except ImportError:
-        print("Configuration error: pydantic not available")
-        print("Please install required dependencies: pip install -r requirements.txt")
-        raise
+import json
+from dataclasses import dataclass
+from os import environ as env
 
+from dotenv import load_dotenv
 
-class Settings(BaseSettings):
-    """Application settings."""
+# Must run before Settings is defined, since its defaults read the environment
+load_dotenv(".env")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean flag from the environment."""
+    value = env.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_list(name: str, default: tuple[str, ...]) -> tuple[str, ...]:
+    """Read a JSON list or a comma-separated list from the environment."""
+    value = env.get(name)
+    if value is None:
+        return default
+    value = value.strip()
+    if value.startswith("["):
+        return tuple(str(item) for item in json.loads(value))
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings, read from environment variables."""
 
     # Application
-    app_name: str = "ecommerce-api"
-    app_version: str = "0.1.0"
-    debug: bool = False
+    app_name: str = env.get("APP_NAME", "ecommerce-api")
+    app_version: str = env.get("APP_VERSION", "0.1.0")
+    debug: bool = _env_bool("DEBUG", False)
 
     # Database
-    database_url: str = "sqlite:///./ecommerce-api.db"
+    database_url: str = env.get("DATABASE_URL", "sqlite:///./ecommerce-api.db")
 
     # Security
-    secret_key: str = "your-secret-key-here"
-    access_token_expire_minutes: int = 30
+    secret_key: str = env.get("SECRET_KEY", "your-secret-key-here")
+    access_token_expire_minutes: int = int(env.get("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
     # CORS
-    cors_origins: list[str] = ["*"]
-    cors_allow_credentials: bool = True
-    cors_allow_methods: list[str] = ["*"]
-    cors_allow_headers: list[str] = ["*"]
-
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-        env_prefix = ""  # No prefix for environment variables
-
-        # Fallback for missing dependencies
-        @classmethod
-        def validate_dependencies(cls):
-            try:
-                # Check if pydantic is available without importing
-                import importlib.util
-
-                return importlib.util.find_spec("pydantic") is not None
-            except ImportError:
-                print("Warning: pydantic not available, using basic settings")
-                return False
-
-
-@lru_cache
+    cors_origins: tuple[str, ...] = _env_list("CORS_ORIGINS", ("*",))
+    cors_allow_credentials: bool = _env_bool("CORS_ALLOW_CREDENTIALS", True)
+    cors_allow_methods: tuple[str, ...] = _env_list("CORS_ALLOW_METHODS", ("*",))
+    cors_allow_headers: tuple[str, ...] = _env_list("CORS_ALLOW_HEADERS", ("*",))
+
+
+# Built once at import; get_settings() hands out this shared instance
+SETTINGS = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the shared settings instance."""
+    return SETTINGS
@@ -1,15 +1,16 @@
 """Main FastAPI application for ecommerce-api."""
 
-from fastapi import FastAPI, HTTPException
+import math
+from collections import defaultdict
+from itertools import count
 
-try:
-    from config.middleware import setup_middleware
-    from config.settings import get_settings
-    from routers import base_router
-except ImportError as e:
-    print(f"Configuration error: {e}")
-    print("Please install required dependencies: pip install -r requirements.txt")
-    raise
+import orjson
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+
+from config.middleware import setup_middleware
+from config.settings import get_settings
+from routers import base_router
 
 # Get application settings
 settings = get_settings()
@@ -20,6 +21,7 @@ app = FastAPI(
     description="A FastAPI project generated with FasCraft - E-commerce API Example",
     version=settings.app_version,
     debug=settings.debug,
+    default_response_class=ORJSONResponse,
 )
 
 # Setup middleware
@@ -79,31 +81,55 @@ orders = [
     },
 ]
 
+# Lookup indexes so handlers don't scan the lists above
+products_by_id: dict[int, dict] = {p["id"]: p for p in products}
+orders_by_id: dict[int, dict] = {o["id"]: o for o in orders}
+products_by_category: defaultdict[str, list[dict]] = defaultdict(list)
+for _product in products:
+    products_by_category[_product["category"].lower()].append(_product)
 
-@app.get("/")
-async def root():
-    """Root endpoint."""
-    return {
+# Id generators, so creating a record doesn't rescan for the current maximum
+_next_product_id = count(max(products_by_id) + 1)
+_next_order_id = count(max(orders_by_id) + 1)
+
+
+# Static payloads, serialized once at import
+ROOT_BODY = orjson.dumps(
+    {
         "message": f"Welcome to {settings.app_name} - E-commerce API!",
         "status": "running",
     }
+)
+
+# Serialized product listings keyed by lowercased category ("" for all);
+# cleared whenever the catalogue changes
+_product_listing_cache: dict[str, bytes] = {}
+
+
+@app.get("/")
+async def root():
+    """Root endpoint."""
+    return Response(ROOT_BODY, media_type="application/json")
 
 
 @app.get("/api/products")
 async def get_products(category: str = None):
     """Get all products or filter by category."""
-    if category:
-        filtered_products = [
-            p for p in products if p["category"].lower() == category.lower()
-        ]
-        return {"products": filtered_products, "count": len(filtered_products)}
-    return {"products": products, "count": len(products)}
+    key = category.lower() if category else ""
+    body = _product_listing_cache.get(key)
+    if body is None:
+        items = products_by_category.get(key, []) if category else products
+        body = orjson.dumps({"products": items, "count": len(items)})
+        # Only cache real categories so arbitrary queries can't grow the cache
+        if not category or key in products_by_category:
+            _product_listing_cache[key] = body
+    return Response(body, media_type="application/json")
 
 
 @app.get("/api/products/{product_id}")
 async def get_product(product_id: int):
     """Get a specific product by ID."""
-    product = next((p for p in products if p["id"] == product_id), None)
+    product = products_by_id.get(product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     return product
@@ -112,7 +138,7 @@ async def get_product(product_id: int):
 @app.post("/api/products")
 async def create_product(name: str, price: float, category: str, stock: int = 0):
     """Create a new product."""
-    new_id = max(p["id"] for p in products) + 1
+    new_id = next(_next_product_id)
     new_product = {
         "id": new_id,
         "name": name,
@@ -121,6 +147,9 @@ async def create_product(name: str, price: float, category: str, stock: int = 0)
         "stock": stock,
     }
     products.append(new_product)
+    products_by_id[new_id] = new_product
+    products_by_category[category.lower()].append(new_product)
+    _product_listing_cache.clear()
     return {"message": "Product created successfully", "product": new_product}
 
 
@@ -133,7 +162,7 @@ async def get_orders():
 @app.get("/api/orders/{order_id}")
 async def get_order(order_id: int):
     """Get a specific order by ID."""
-    order = next((o for o in orders if o["id"] == order_id), None)
+    order = orders_by_id.get(order_id)
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     return order
@@ -147,27 +176,23 @@ async def create_order(customer_id: int, product_ids: list[int], quantities: lis
             status_code=400, detail="Product IDs and quantities must match"
         )
 
-    order_items = []
-    total = 0.0
+    pairs = list(zip(product_ids, quantities, strict=True))
 
-    for i, product_id in enumerate(product_ids):
-        product = next((p for p in products if p["id"] == product_id), None)
-        if not product:
-            raise HTTPException(
-                status_code=404, detail=f"Product {product_id} not found"
-            )
+    missing = [pid for pid, _ in pairs if pid not in products_by_id]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Products {missing} not found")
 
-        quantity = quantities[i]
-        if product["stock"] < quantity:
-            raise HTTPException(
-                status_code=400, detail=f"Insufficient stock for product {product_id}"
-            )
+    understocked = [pid for pid, qty in pairs if products_by_id[pid]["stock"] < qty]
+    if understocked:
+        raise HTTPException(
+            status_code=400, detail=f"Insufficient stock for products {understocked}"
+        )
 
-        order_items.append({"product_id": product_id, "quantity": quantity})
-        total += product["price"] * quantity
+    order_items = [{"product_id": pid, "quantity": qty} for pid, qty in pairs]
+    total = math.fsum(products_by_id[pid]["price"] * qty for pid, qty in pairs)
 
     new_order = {
-        "id": max(o["id"] for o in orders) + 1,
+        "id": next(_next_order_id),
         "customer_id": customer_id,
         "products": order_items,
         "total": round(total, 2),
@@ -175,6 +200,7 @@ async def create_order(customer_id: int, product_ids: list[int], quantities: lis
     }
 
     orders.append(new_order)
+    orders_by_id[new_order["id"]] = new_order
     return {"message": "Order created successfully", "order": new_order}
 
 
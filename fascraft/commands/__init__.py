@@ -1,20 +1,6 @@
 """FasCraft CLI commands package."""
 
-from . import (
-    analyze,
-    analyze_dependencies,
-    config,
-    dependencies,
-    docs,
-    generate,
-    generate_test,
-    list,
-    list_templates,
-    migrate,
-    new,
-    remove,
-    update,
-)
+import importlib
 
 __all__ = [
     "new",
@@ -31,3 +17,12 @@ __all__ = [
     "generate_test",
     "docs",
 ]
+
+
+def __getattr__(name: str):
+    """Import command modules on first access rather than at package import."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,82 @@
 """Command for analyzing existing FastAPI projects and suggesting improvements."""
 
 import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 import typer
-from rich.console import Console
+from rich.console import Group
 from rich.table import Table
 from rich.text import Text
 
-# Initialize rich console
-console = Console()
+from fascraft.console import console
+
+# Projects are analyzed independently, so their file reads can overlap on threads
+ANALYZE_WORKERS = 32
+
+# Directories skipped when looking at the project layout
+IGNORED_DIRS = frozenset({"__pycache__", ".git", ".venv", "venv", "env"})
+
+# Layer-named directories that indicate a flat, non-domain structure
+FLAT_STRUCTURE_DIRS = frozenset({"models", "schemas", "services", "routers"})
+
+# Files that mark a directory as a domain module
+DOMAIN_MODULE_FILES = frozenset({"__init__.py", "models.py"})
+
+# FastAPI detection: main.py markers, then a case-insensitive pyproject marker.
+# Without a file cache only the head of a file is read, unless it has no match
+FASTAPI_MAIN_MARKERS = (b"FastAPI", b"fastapi")
+FASTAPI_PYPROJECT_MARKER = b"fastapi"
+FASTAPI_PROBE_SIZE = 4096
+
+# README scoring: case-sensitive structure markers, then groups of keywords
+# matched case-insensitively, each with the points it is worth
+README_STRUCTURE_MARKERS = (
+    (b"# ", 10),  # Has title
+    (b"## ", 10),  # Has sections
+    (b"```", 10),  # Has code blocks
+    (b"http", 5),  # Has links
+)
+README_KEYWORD_GROUPS = (
+    ((b"requirements", b"dependencies"), 10),
+    ((b"install", b"setup"), 10),
+    ((b"usage", b"example"), 10),
+    ((b"api", b"endpoint"), 10),
+    ((b"test",), 5),
+    ((b"contributing",), 5),
+    ((b"license",), 5),
+)
+
+# CHANGELOG scoring: version sections and Keep a Changelog categories
+CHANGELOG_MARKERS = (
+    b"## [",
+    b"### Added",
+    b"### Changed",
+    b"### Fixed",
+    b"### Security",
+)
+CHANGELOG_MARKER_POINTS = 20
+
+# Version patterns, most specific first
+README_VERSION_PATTERNS = (
+    re.compile(rb"version[:\s]+([0-9]+\.[0-9]+\.[0-9]+)", re.IGNORECASE),
+    re.compile(rb"v([0-9]+\.[0-9]+\.[0-9]+)", re.IGNORECASE),
+    re.compile(rb"([0-9]+\.[0-9]+\.[0-9]+)", re.IGNORECASE),
+)
+# First line mentioning "version" with an "=", capturing up to the next "=";
+# the search stops there instead of splitting the whole file into lines
+PYPROJECT_VERSION_PATTERN = re.compile(
+    rb"(?:^|(?<=[\r\n]))(?=[^\r\n]*version)[^\r\n=]*=([^\r\n=]*)"
+)
+CHANGELOG_VERSION_PATTERN = re.compile(rb"## \[([0-9]+\.[0-9]+\.[0-9]+)\]")
+SEMANTIC_VERSION_PATTERN = re.compile(
+    r"^[0-9]+\.[0-9]+\.[0-9]+(?:-[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?"
+    r"(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$"
+)
 
 
 def analyze_project(
@@ -26,14 +92,16 @@ def analyze_project(
     ),
 ) -> None:
     """🔍 Analyzes a FastAPI project and suggests improvements."""
-    path_obj = Path(path)
+    # Convert once here; everything below is handed this same Path
+    path_obj = path if isinstance(path, Path) else Path(path)
+    file_cache = ProjectFileCache()
 
     if not path_obj.exists():
         error_text = Text("❌ Error: Path does not exist.", style="bold red")
         console.print(error_text)
         raise typer.Exit(code=1)
 
-    if not is_fastapi_project(path_obj):
+    if not is_fastapi_project(path_obj, file_cache):
         error_text = Text("❌ Error: This is not a FastAPI project.", style="bold red")
         console.print(error_text)
         raise typer.Exit(code=1)
@@ -45,7 +113,9 @@ def analyze_project(
         )
 
         # Generate version report
-        version_report_data = generate_documentation_version_report(path_obj)
+        version_report_data = generate_documentation_version_report(
+            path_obj, file_cache
+        )
 
         # Display version report
         display_version_report(version_report_data)
@@ -56,7 +126,7 @@ def analyze_project(
         )
 
         # Analyze only documentation
-        doc_analysis = analyze_documentation_quality(path_obj)
+        doc_analysis = analyze_documentation_quality(path_obj, file_cache)
 
         # Display documentation analysis results
         display_documentation_analysis(doc_analysis)
@@ -80,7 +150,7 @@ def analyze_project(
         console.print(f"🔍 Analyzing project at: {path_obj}", style="bold blue")
 
         # Analyze project structure
-        analysis = analyze_project_structure(path_obj)
+        analysis = analyze_project_structure(path_obj, file_cache)
 
         # Display analysis results
         display_analysis_results(analysis)
@@ -89,25 +159,124 @@ def analyze_project(
         provide_recommendations(analysis)
 
 
-def is_fastapi_project(project_path: Path) -> bool:
+class AnalysisRecord:
+    """Dict-style reads for analysis results, for callers that still index them."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+
+@dataclass(slots=True)
+class ConfigAnalysis(AnalysisRecord):
+    """Findings for a project's config directory."""
+
+    files: list[str] = field(default_factory=list)
+    has_settings: bool = False
+    has_database: bool = False
+
+
+@dataclass(slots=True)
+class MainPyAnalysis(AnalysisRecord):
+    """Findings for a project's main.py."""
+
+    has_fastapi_import: bool = False
+    has_router_includes: bool = False
+    router_count: int = 0
+    has_base_router: bool = False
+    lines: int = 0
+
+
+class ProjectFileCache:
+    """Project file contents, read at most once per analysis run."""
+
+    def __init__(self) -> None:
+        self._contents: dict[Path, bytes | None] = {}
+
+    def read(self, path: Path) -> bytes | None:
+        """Return the bytes of a file, or None if it does not exist."""
+        try:
+            return self._contents[path]
+        except KeyError:
+            pass
+        try:
+            content = path.read_bytes()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            content = None
+        self._contents[path] = content
+        return content
+
+
+def is_fastapi_project(
+    project_path: Path, file_cache: ProjectFileCache | None = None
+) -> bool:
     """Check if the given path is a FastAPI project."""
+    if file_cache is None:
+        # Standalone check: probe the start of each file and stop at a match
+        return file_contains(
+            project_path / "main.py", FASTAPI_MAIN_MARKERS
+        ) or file_contains(
+            project_path / "pyproject.toml",
+            (FASTAPI_PYPROJECT_MARKER,),
+            ignore_case=True,
+        )
+
     # Check for FastAPI indicators
-    if (project_path / "main.py").exists():
-        content = (project_path / "main.py").read_text()
-        if "FastAPI" in content or "fastapi" in content:
-            return True
+    content = file_cache.read(project_path / "main.py")
+    if content is not None and contains_marker(content, FASTAPI_MAIN_MARKERS):
+        return True
 
     # Check for pyproject.toml with FastAPI dependency
-    if (project_path / "pyproject.toml").exists():
-        content = (project_path / "pyproject.toml").read_text()
-        if "fastapi" in content.lower():
-            return True
-
-    return False
+    content = file_cache.read(project_path / "pyproject.toml")
+    return content is not None and contains_marker(
+        content, (FASTAPI_PYPROJECT_MARKER,), ignore_case=True
+    )
 
 
-def analyze_project_structure(project_path: Path) -> dict:
+def file_contains(
+    path: Path, markers: tuple[bytes, ...], ignore_case: bool = False
+) -> bool:
+    """Check whether a file contains any marker, reading only its head if it can."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(FASTAPI_PROBE_SIZE)
+            if contains_marker(head, markers, ignore_case):
+                return True
+            rest = f.read()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return False
+    return bool(rest) and contains_marker(head + rest, markers, ignore_case)
+
+
+def contains_marker(
+    content: bytes, markers: tuple[bytes, ...], ignore_case: bool = False
+) -> bool:
+    """Check whether content contains any of the given markers."""
+    if ignore_case:
+        content = content.lower()
+    return any(marker in content for marker in markers)
+
+
+def analyze_projects(paths: list[Path]) -> list[dict]:
+    """Analyze the structure of several projects concurrently, in input order."""
+    if not paths:
+        return []
+    with ThreadPoolExecutor(max_workers=min(ANALYZE_WORKERS, len(paths))) as executor:
+        return list(executor.map(analyze_project_structure, paths))
+
+
+def analyze_project_structure(
+    project_path: Path, file_cache: ProjectFileCache | None = None
+) -> dict:
     """Analyze the project structure and return analysis results."""
+    file_cache = file_cache or ProjectFileCache()
     analysis = {
         "project_name": project_path.name,
         "structure": {},
@@ -118,38 +287,48 @@ def analyze_project_structure(project_path: Path) -> dict:
         "suggestions": [],
     }
 
-    # Analyze directory structure
-    for item in project_path.iterdir():
-        if item.is_dir():
-            if item.name in ["__pycache__", ".git", ".venv", "venv", "env"]:
-                continue
+    # Analyze directory structure; one directory read gives names and types
+    with os.scandir(project_path) as entries:
+        entries = list(entries)
+    entry_names = {entry.name for entry in entries}
 
-            if item.name == "config":
-                analysis["structure"]["config"] = analyze_config_directory(item)
-            elif item.name in ["models", "schemas", "services", "routers"]:
-                analysis["structure"]["flat_structure"] = True
-                analysis["suggestions"].append(
-                    "Consider converting to domain-driven architecture"
+    dir_entries = [entry for entry in entries if entry.is_dir()]
+
+    # Any layer-named directory means the project is organised by layer
+    if FLAT_STRUCTURE_DIRS.intersection(entry.name for entry in dir_entries):
+        analysis["structure"]["flat_structure"] = True
+        analysis["suggestions"].append(
+            "Consider converting to domain-driven architecture"
+        )
+
+    for entry in dir_entries:
+        name = entry.name
+        if name in IGNORED_DIRS or name in FLAT_STRUCTURE_DIRS:
+            continue
+
+        if name == "config":
+            analysis["structure"]["config"] = analyze_config_directory(
+                project_path / name
+            )
+        elif not name.startswith("."):
+            # Check if it's a domain module, scanning by the entry's own path
+            if DOMAIN_MODULE_FILES <= list_entry_names(entry.path):
+                analysis["modules"].append(name)
+            else:
+                analysis["structure"]["other_dirs"] = analysis["structure"].get(
+                    "other_dirs", []
                 )
-            elif not item.name.startswith("."):
-                # Check if it's a domain module
-                if (item / "__init__.py").exists() and (item / "models.py").exists():
-                    analysis["modules"].append(item.name)
-                else:
-                    analysis["structure"]["other_dirs"] = analysis["structure"].get(
-                        "other_dirs", []
-                    )
-                    analysis["structure"]["other_dirs"].append(item.name)
+                analysis["structure"]["other_dirs"].append(name)
 
     # Analyze main.py
     main_py_path = project_path / "main.py"
-    if main_py_path.exists():
-        analysis["main_py"] = analyze_main_py(main_py_path)
+    if file_cache.read(main_py_path) is not None:
+        analysis["main_py"] = analyze_main_py(main_py_path, file_cache)
 
     # Check for configuration files
     config_files = ["fascraft.toml", ".env", "pyproject.toml", "requirements.txt"]
     for config_file in config_files:
-        if (project_path / config_file).exists():
+        if config_file in entry_names:
             analysis["config_files"].append(config_file)
 
     # Identify missing components
@@ -163,13 +342,25 @@ def analyze_project_structure(project_path: Path) -> dict:
         analysis["missing_components"].append("FasCraft configuration")
 
     # Analyze documentation quality
-    analysis["documentation"] = analyze_documentation_quality(project_path)
+    analysis["documentation"] = analyze_documentation_quality(project_path, file_cache)
 
     return analysis
 
 
-def analyze_documentation_quality(project_path: Path) -> dict:
+def list_entry_names(directory: str | os.PathLike) -> set[str]:
+    """Return the names of a directory's entries, or an empty set if unreadable."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def analyze_documentation_quality(
+    project_path: Path, file_cache: ProjectFileCache | None = None
+) -> dict:
     """Analyze documentation quality and completeness."""
+    file_cache = file_cache or ProjectFileCache()
     doc_analysis = {
         "has_readme": False,
         "has_changelog": False,
@@ -187,15 +378,17 @@ def analyze_documentation_quality(project_path: Path) -> dict:
 
     # Check for README
     readme_path = project_path / "README.md"
-    if readme_path.exists():
+    if file_cache.read(readme_path) is not None:
         doc_analysis["has_readme"] = True
-        doc_analysis["readme_quality"] = analyze_readme_quality(readme_path)
+        doc_analysis["readme_quality"] = analyze_readme_quality(readme_path, file_cache)
 
     # Check for CHANGELOG
     changelog_path = project_path / "CHANGELOG.md"
-    if changelog_path.exists():
+    if file_cache.read(changelog_path) is not None:
         doc_analysis["has_changelog"] = True
-        doc_analysis["changelog_quality"] = analyze_changelog_quality(changelog_path)
+        doc_analysis["changelog_quality"] = analyze_changelog_quality(
+            changelog_path, file_cache
+        )
 
     # Check for docs directory
     docs_path = project_path / "docs"
@@ -236,7 +429,7 @@ def analyze_documentation_quality(project_path: Path) -> dict:
         doc_analysis["missing_docs"].append("Project Overview")
 
     # Get version information
-    doc_analysis["version_info"] = extract_version_info(project_path)
+    doc_analysis["version_info"] = extract_version_info(project_path, file_cache)
 
     # Generate suggestions
     doc_analysis["doc_suggestions"] = generate_doc_suggestions(doc_analysis)
@@ -244,56 +437,47 @@ def analyze_documentation_quality(project_path: Path) -> dict:
     return doc_analysis
 
 
-def analyze_readme_quality(readme_path: Path) -> int:
+def analyze_readme_quality(
+    readme_path: Path, file_cache: ProjectFileCache | None = None
+) -> int:
     """Analyze README quality and return a score (0-100)."""
-    content = readme_path.read_text()
-    score = 0
-
-    # Basic structure checks
-    if "# " in content:  # Has title
-        score += 10
-    if "## " in content:  # Has sections
-        score += 10
-    if "```" in content:  # Has code blocks
-        score += 10
-    if "http" in content:  # Has links
-        score += 5
-    if "requirements" in content.lower() or "dependencies" in content.lower():
-        score += 10
-    if "install" in content.lower() or "setup" in content.lower():
-        score += 10
-    if "usage" in content.lower() or "example" in content.lower():
-        score += 10
-    if "api" in content.lower() or "endpoint" in content.lower():
-        score += 10
-    if "test" in content.lower():
-        score += 5
-    if "contributing" in content.lower():
-        score += 5
-    if "license" in content.lower():
-        score += 5
+    # Markers are ASCII, so search the raw bytes without decoding them
+    content = (file_cache or ProjectFileCache()).read(readme_path) or b""
+    lowered = content.lower()
+    score = sum(
+        points for marker, points in README_STRUCTURE_MARKERS if marker in content
+    )
+    score += sum(
+        points
+        for keywords, points in README_KEYWORD_GROUPS
+        if any(keyword in lowered for keyword in keywords)
+    )
 
     return min(score, 100)
 
 
-def analyze_changelog_quality(changelog_path: Path) -> int:
+def analyze_changelog_quality(
+    changelog_path: Path, file_cache: ProjectFileCache | None = None
+) -> int:
     """Analyze changelog quality and return a score (0-100)."""
-    content = changelog_path.read_text()
-    score = 0
-
-    # Structure checks
-    if "## [" in content:  # Has version sections
-        score += 20
-    if "### Added" in content:  # Has change categories
-        score += 20
-    if "### Changed" in content:
-        score += 20
-    if "### Fixed" in content:
-        score += 20
-    if "### Security" in content:
-        score += 20
+    content = (file_cache or ProjectFileCache()).read(changelog_path) or b""
+
+    # Each marker search resumes after the previous hit, so a changelog that
+    # lists them in order is scanned about once rather than once per marker
+    found = 0
+    offset = 0
+    for bit, marker in enumerate(CHANGELOG_MARKERS):
+        index = content.find(marker, offset)
+        if index == -1:
+            # Out of order: fall back to the part already passed over
+            index = content.find(marker, 0, offset + len(marker) - 1)
+            if index == -1:
+                continue
+        else:
+            offset = index + len(marker)
+        found |= 1 << bit
 
-    return min(score, 100)
+    return min(found.bit_count() * CHANGELOG_MARKER_POINTS, 100)
 
 
 def analyze_api_docs_quality(project_path: Path) -> int:
@@ -345,8 +529,11 @@ def analyze_docs_directory(docs_path: Path) -> dict:
     return docs_analysis
 
 
-def extract_version_info(project_path: Path) -> dict:
+def extract_version_info(
+    project_path: Path, file_cache: ProjectFileCache | None = None
+) -> dict:
     """Extract version information from various sources."""
+    file_cache = file_cache or ProjectFileCache()
     version_info = {
         "pyproject_version": None,
         "readme_version": None,
@@ -356,43 +543,28 @@ def extract_version_info(project_path: Path) -> dict:
     }
 
     # Check pyproject.toml
-    pyproject_path = project_path / "pyproject.toml"
-    if pyproject_path.exists():
-        content = pyproject_path.read_text()
-        for line in content.split("\n"):
-            if "version" in line and "=" in line:
-                version = line.split("=")[1].strip().strip('"').strip("'")
-                if version:
-                    version_info["pyproject_version"] = version
-                break
+    content = file_cache.read(project_path / "pyproject.toml")
+    if content is not None:
+        version = find_pyproject_version(content)
+        if version:
+            version_info["pyproject_version"] = version
 
     # Check README for version
-    readme_path = project_path / "README.md"
-    if readme_path.exists():
-        content = readme_path.read_text()
+    content = file_cache.read(project_path / "README.md")
+    if content is not None:
         # Look for version patterns
-        import re
-
-        version_patterns = [
-            r"version[:\s]+([0-9]+\.[0-9]+\.[0-9]+)",
-            r"v([0-9]+\.[0-9]+\.[0-9]+)",
-            r"([0-9]+\.[0-9]+\.[0-9]+)",
-        ]
-        for pattern in version_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in README_VERSION_PATTERNS:
+            match = pattern.search(content)
             if match:
-                version_info["readme_version"] = match.group(1)
+                version_info["readme_version"] = match.group(1).decode()
                 break
 
     # Check CHANGELOG for latest version
-    changelog_path = project_path / "CHANGELOG.md"
-    if changelog_path.exists():
-        content = changelog_path.read_text()
-        import re
-
-        version_match = re.search(r"## \[([0-9]+\.[0-9]+\.[0-9]+)\]", content)
+    content = file_cache.read(project_path / "CHANGELOG.md")
+    if content is not None:
+        version_match = CHANGELOG_VERSION_PATTERN.search(content)
         if version_match:
-            version_info["changelog_version"] = version_match.group(1)
+            version_info["changelog_version"] = version_match.group(1).decode()
 
     # Determine latest version
     versions = [
@@ -459,8 +631,11 @@ def generate_doc_suggestions(doc_analysis: dict) -> list[str]:
     return suggestions
 
 
-def generate_documentation_version_report(project_path: Path) -> dict:
+def generate_documentation_version_report(
+    project_path: Path, file_cache: ProjectFileCache | None = None
+) -> dict:
     """Generate a comprehensive documentation version report."""
+    file_cache = file_cache or ProjectFileCache()
     version_report = {
         "timestamp": datetime.now().isoformat(),
         "project_path": str(project_path),
@@ -470,37 +645,29 @@ def generate_documentation_version_report(project_path: Path) -> dict:
     }
 
     # Extract version from pyproject.toml
-    pyproject_path = project_path / "pyproject.toml"
-    if pyproject_path.exists():
-        content = pyproject_path.read_text()
-        for line in content.split("\n"):
-            if "version" in line and "=" in line:
-                version = line.split("=")[1].strip().strip('"').strip("'")
-                if version:
-                    version_report["version_sources"]["pyproject.toml"] = version
-                break
+    content = file_cache.read(project_path / "pyproject.toml")
+    if content is not None:
+        version = find_pyproject_version(content)
+        if version:
+            version_report["version_sources"]["pyproject.toml"] = version
 
     # Extract version from README
-    readme_path = project_path / "README.md"
-    if readme_path.exists():
-        content = readme_path.read_text()
-        import re
-
-        version_match = re.search(
-            r"version[:\s]+([0-9]+\.[0-9]+\.[0-9]+)", content, re.IGNORECASE
-        )
+    content = file_cache.read(project_path / "README.md")
+    if content is not None:
+        version_match = README_VERSION_PATTERNS[0].search(content)
         if version_match:
-            version_report["version_sources"]["README.md"] = version_match.group(1)
+            version_report["version_sources"]["README.md"] = version_match.group(
+                1
+            ).decode()
 
     # Extract version from CHANGELOG
-    changelog_path = project_path / "CHANGELOG.md"
-    if changelog_path.exists():
-        content = changelog_path.read_text()
-        import re
-
-        version_match = re.search(r"## \[([0-9]+\.[0-9]+\.[0-9]+)\]", content)
+    content = file_cache.read(project_path / "CHANGELOG.md")
+    if content is not None:
+        version_match = CHANGELOG_VERSION_PATTERN.search(content)
         if version_match:
-            version_report["version_sources"]["CHANGELOG.md"] = version_match.group(1)
+            version_report["version_sources"]["CHANGELOG.md"] = version_match.group(
+                1
+            ).decode()
 
     # Check for version consistency
     versions = list(version_report["version_sources"].values())
@@ -531,47 +698,64 @@ def generate_documentation_version_report(project_path: Path) -> dict:
     return version_report
 
 
+def find_pyproject_version(content: bytes) -> str | None:
+    """Return the value of the first version assignment in pyproject.toml."""
+    match = PYPROJECT_VERSION_PATTERN.search(content)
+    if match is None:
+        return None
+    version = match.group(1).strip().strip(b'"').strip(b"'")
+    return version.decode("utf-8", "replace") or None
+
+
 def is_semantic_version(version: str) -> bool:
     """Check if a version string follows semantic versioning."""
-    import re
-
-    pattern = r"^[0-9]+\.[0-9]+\.[0-9]+(?:-[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$"
-    return bool(re.match(pattern, version))
+    return bool(SEMANTIC_VERSION_PATTERN.match(version))
 
 
-def analyze_config_directory(config_path: Path) -> dict:
+def analyze_config_directory(config_path: Path) -> ConfigAnalysis:
     """Analyze the config directory structure."""
-    config_analysis = {"files": [], "has_settings": False, "has_database": False}
+    config_analysis = ConfigAnalysis()
 
-    for item in config_path.iterdir():
-        if item.is_file():
-            config_analysis["files"].append(item.name)
-            if item.name == "settings.py":
-                config_analysis["has_settings"] = True
-            elif item.name == "database.py":
-                config_analysis["has_database"] = True
+    with os.scandir(config_path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                config_analysis.files.append(entry.name)
+                if entry.name == "settings.py":
+                    config_analysis.has_settings = True
+                elif entry.name == "database.py":
+                    config_analysis.has_database = True
 
     return config_analysis
 
 
-def analyze_main_py(main_py_path: Path) -> dict:
+def analyze_main_py(
+    main_py_path: Path, file_cache: ProjectFileCache | None = None
+) -> MainPyAnalysis:
     """Analyze the main.py file structure."""
-    content = main_py_path.read_text()
+    content = (file_cache or ProjectFileCache()).read(main_py_path) or b""
+    router_count = content.count(b"app.include_router")
+
+    return MainPyAnalysis(
+        has_fastapi_import=b"FastAPI" in content,
+        has_router_includes=router_count > 0,
+        router_count=router_count,
+        has_base_router=b"from routers import base_router" in content,
+        lines=count_lines(content),
+    )
 
-    analysis = {
-        "has_fastapi_import": "FastAPI" in content,
-        "has_router_includes": "app.include_router" in content,
-        "router_count": content.count("app.include_router"),
-        "has_base_router": "from routers import base_router" in content,
-        "lines": len(content.split("\n")),
-    }
 
-    return analysis
+def count_lines(content: bytes) -> int:
+    """Count lines the way splitting universal-newline text on "\\n" would."""
+    crlf = content.count(b"\r\n")
+    return content.count(b"\n") + content.count(b"\r") - crlf + 1
 
 
 def display_analysis_results(analysis: dict) -> None:
     """Display the analysis results in a formatted table."""
-    console.print("\n📊 Project Analysis Results", style="bold green")
+    # Collect everything first so the results are rendered in a single print
+    renderables = [
+        console.render_str("\n📊 Project Analysis Results", style="bold green")
+    ]
 
     # Project overview
     overview_table = Table(title="Project Overview")
@@ -585,11 +769,13 @@ def display_analysis_results(analysis: dict) -> None:
         "Router Includes", str(analysis.get("main_py", {}).get("router_count", 0))
     )
 
-    console.print(overview_table)
+    renderables.append(overview_table)
 
     # Structure analysis
     if analysis["structure"]:
-        console.print("\n🏗️ Structure Analysis", style="bold blue")
+        renderables.append(
+            console.render_str("\n🏗️ Structure Analysis", style="bold blue")
+        )
         structure_table = Table()
         structure_table.add_column("Component", style="cyan")
         structure_table.add_column("Status", style="white")
@@ -610,15 +796,19 @@ def display_analysis_results(analysis: dict) -> None:
                 "Architecture", "⚠️ Flat Structure (Consider domain-driven)"
             )
 
-        console.print(structure_table)
+        renderables.append(structure_table)
 
     # Modules found
     if analysis["modules"]:
-        console.print(
-            f"\n📦 Domain Modules Found: {', '.join(analysis['modules'])}",
-            style="bold green",
+        renderables.append(
+            console.render_str(
+                f"\n📦 Domain Modules Found: {', '.join(analysis['modules'])}",
+                style="bold green",
+            )
         )
 
+    console.print(Group(*renderables))
+
 
 def display_documentation_analysis(doc_analysis: dict) -> None:
     """Display documentation analysis results."""
@@ -767,7 +957,8 @@ def display_version_report(version_report: dict) -> None:
 
 def provide_recommendations(analysis: dict) -> None:
     """Provide specific recommendations based on analysis."""
-    console.print("\n💡 Recommendations", style="bold yellow")
+    # Collect everything first so the recommendations are rendered in one print
+    renderables = [console.render_str("\n💡 Recommendations", style="bold yellow")]
 
     recommendations = []
 
@@ -795,22 +986,38 @@ def provide_recommendations(analysis: dict) -> None:
     if "documentation" in analysis:
         doc_suggestions = analysis["documentation"]["doc_suggestions"]
         if doc_suggestions:
-            console.print("\n📚 Documentation Recommendations:", style="bold magenta")
+            renderables.append(
+                console.render_str(
+                    "\n📚 Documentation Recommendations:", style="bold magenta"
+                )
+            )
             for i, suggestion in enumerate(doc_suggestions, 1):
-                console.print(f"  {i}. {suggestion}", style="white")
+                renderables.append(
+                    console.render_str(f"  {i}. {suggestion}", style="white")
+                )
 
-            console.print(
-                "\n💡 Use 'fascraft docs generate' to create missing documentation",
-                style="bold cyan",
+            renderables.append(
+                console.render_str(
+                    "\n💡 Use 'fascraft docs generate' to create missing documentation",
+                    style="bold cyan",
+                )
             )
 
     if not recommendations:
-        console.print("🎉 Your project follows best practices!", style="bold green")
+        renderables.append(
+            console.render_str(
+                "🎉 Your project follows best practices!", style="bold green"
+            )
+        )
     else:
         for i, rec in enumerate(recommendations, 1):
-            console.print(f"{i}. {rec}", style="white")
+            renderables.append(console.render_str(f"{i}. {rec}", style="white"))
 
-    console.print(
-        "\n🚀 Use 'fascraft migrate' to automatically apply improvements",
-        style="bold cyan",
+    renderables.append(
+        console.render_str(
+            "\n🚀 Use 'fascraft migrate' to automatically apply improvements",
+            style="bold cyan",
+        )
     )
+
+    console.print(Group(*renderables))
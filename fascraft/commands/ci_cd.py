@@ -1,21 +1,53 @@
 """Command for adding CI/CD support to existing FastAPI projects."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
-from jinja2 import Environment, PackageLoader, select_autoescape
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
 
+from fascraft.console import console
 from fascraft.exceptions import FasCraftError, FileSystemError, TemplateRenderError
 from fascraft.validation import validate_path_robust
 
-# Initialize rich console
-console = Console(width=None, soft_wrap=False)
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
 app = typer.Typer(help="🚀 Add CI/CD support to existing FastAPI projects")
 
+# Extensions of GitHub workflow files reported as existing CI/CD files
+WORKFLOW_EXTENSIONS = (".yml", ".yaml")
+
+# .env files for the different deployment environments, encoded up front
+ENVIRONMENT_CONFIGS = {
+    ".env.dev": b"ENVIRONMENT=development\nDEBUG=true\nLOG_LEVEL=DEBUG",
+    ".env.staging": b"ENVIRONMENT=staging\nDEBUG=false\nLOG_LEVEL=INFO",
+    ".env.prod": b"ENVIRONMENT=production\nDEBUG=false\nLOG_LEVEL=WARNING",
+}
+
+
+@lru_cache(maxsize=1)
+def _make_env() -> "Environment":
+    """Build the shared CI/CD Jinja2 environment on first use.
+
+    Jinja2 is imported here rather than at module level so loading this
+    command (or collecting its tests) doesn't pay for it until a template
+    is actually rendered. The environment is cached so each CI/CD template
+    is still compiled once per process.
+    """
+    from jinja2 import Environment, PackageLoader, select_autoescape
+
+    from fascraft.commands.new import get_bytecode_cache
+
+    return Environment(
+        loader=PackageLoader("fascraft", "templates/new_project"),
+        autoescape=select_autoescape(),
+        auto_reload=False,
+        bytecode_cache=get_bytecode_cache(),
+    )
+
 
 @app.command()
 def add_ci_cd(
@@ -78,34 +110,40 @@ def check_existing_ci_cd_files(project_path: Path, platform: str) -> list:
     existing_files = []
 
     if platform in ["github", "both"]:
-        github_dir = project_path / ".github" / "workflows"
-        if github_dir.exists():
-            for workflow_file in github_dir.glob("*.yml"):
-                existing_files.append(f".github/workflows/{workflow_file.name}")
+        # One directory read; DirEntry caches the file type from it
+        try:
+            with os.scandir(project_path / ".github" / "workflows") as entries:
+                for entry in entries:
+                    if entry.name.endswith(WORKFLOW_EXTENSIONS) and entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        existing_files.append(f".github/workflows/{entry.name}")
+        except (FileNotFoundError, NotADirectoryError):
+            pass
 
     if platform in ["gitlab", "both"]:
-        gitlab_file = project_path / ".gitlab-ci.yml"
-        if gitlab_file.exists():
+        if (project_path / ".gitlab-ci.yml").is_file():
             existing_files.append(".gitlab-ci.yml")
 
-    pre_commit_file = project_path / ".pre-commit-config.yaml"
-    if pre_commit_file.exists():
+    if (project_path / ".pre-commit-config.yaml").is_file():
         existing_files.append(".pre-commit-config.yaml")
 
     return existing_files
 
 
-def add_ci_cd_support(project_path: Path, platform: str, force: bool) -> None:
+def add_ci_cd_support(
+    project_path: Path, platform: str, force: bool, env: "Environment | None" = None
+) -> None:
     """Add CI/CD support to the project."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     try:
         # Get project name from directory
         project_name = project_path.name
 
-        # Setup Jinja2 environment
-        env = Environment(
-            loader=PackageLoader("fascraft", "templates/new_project"),
-            autoescape=select_autoescape(),
-        )
+        # Reuse the shared Jinja2 environment unless one is supplied
+        if env is None:
+            env = _make_env()
 
         # CI/CD templates to render
         ci_cd_templates = []
@@ -137,10 +175,18 @@ def add_ci_cd_support(project_path: Path, platform: str, force: bool) -> None:
                 "Adding CI/CD support...", total=len(ci_cd_templates)
             )
 
+            # Directories already created during this run, to skip repeat mkdirs
+            created_dirs: set[Path] = set()
+
             for template_name, output_name in ci_cd_templates:
                 try:
                     render_ci_cd_template(
-                        env, project_path, project_name, template_name, output_name
+                        env,
+                        project_path,
+                        project_name,
+                        template_name,
+                        output_name,
+                        created_dirs,
                     )
                     progress.advance(task)
                 except Exception as e:
@@ -154,21 +200,26 @@ def add_ci_cd_support(project_path: Path, platform: str, force: bool) -> None:
 
 
 def render_ci_cd_template(
-    env: Environment,
+    env: "Environment",
     project_path: Path,
     project_name: str,
     template_name: str,
     output_name: str,
+    created_dirs: set[Path] | None = None,
 ) -> None:
     """Render a single CI/CD template."""
     try:
         template = env.get_template(template_name)
-        content = template.render(project_name=project_name)
+        content = template.render(project_name=project_name).encode("utf-8")
 
         output_path = project_path / output_name
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if created_dirs is None or output_path.parent not in created_dirs:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if created_dirs is not None:
+                created_dirs.add(output_path.parent)
 
-        with open(output_path, "w", encoding="utf-8") as f:
+        # Write the rendered bytes in one call, skipping the text-mode layer
+        with open(output_path, "wb") as f:
             f.write(content)
 
     except Exception as e:
@@ -275,18 +326,14 @@ def setup_ci_cd_environments(project_path: Path) -> None:
 
 def create_environment_configs(project_path: Path) -> None:
     """Create environment configuration files."""
-    # Create .env files for different environments
-    env_files = {
-        ".env.dev": "ENVIRONMENT=development\nDEBUG=true\nLOG_LEVEL=DEBUG",
-        ".env.staging": "ENVIRONMENT=staging\nDEBUG=false\nLOG_LEVEL=INFO",
-        ".env.prod": "ENVIRONMENT=production\nDEBUG=false\nLOG_LEVEL=WARNING",
-    }
-
-    for filename, content in env_files.items():
-        env_file = project_path / filename
-        if not env_file.exists():
-            env_file.write_text(content)
-            console.print(f"📝 Created {filename}", style="green")
+    for filename, content in ENVIRONMENT_CONFIGS.items():
+        # Exclusive create replaces a separate exists() check before writing
+        try:
+            with open(project_path / filename, "xb") as f:
+                f.write(content)
+        except FileExistsError:
+            continue
+        console.print(f"📝 Created {filename}", style="green")
 
 
 def setup_pre_commit_hooks(project_path: Path) -> None:
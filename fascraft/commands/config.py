@@ -10,12 +10,10 @@ from pathlib import Path
 
 import tomli_w
 import typer
-from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
-# Initialize rich console
-console = Console()
+from fascraft.console import console
 
 
 def manage_config(
@@ -3,16 +3,13 @@
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 from rich.tree import Tree
 
+from fascraft.console import console
 from fascraft.module_dependencies import dependency_analyzer, dependency_graph
 
-# Initialize rich console
-console = Console()
-
 # Create sub-app for dependencies
 dependencies_app = typer.Typer(
     help="🔗 Manage module dependencies in your FastAPI project", name="dependencies"
@@ -4,16 +4,13 @@ from pathlib import Path
 
 import typer
 from jinja2 import Environment, PackageLoader, select_autoescape
-from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
 
+from fascraft.console import console
 from fascraft.exceptions import FasCraftError, FileSystemError, TemplateRenderError
 from fascraft.validation import validate_path_robust
 
-# Initialize rich console
-console = Console(width=None, soft_wrap=False)
-
 app = typer.Typer(help="🐳 Add Docker support to existing FastAPI projects")
 
 
@@ -3,15 +3,12 @@
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from rich.text import Text
 
+from fascraft.console import console
 from fascraft.exceptions import ModuleNotFoundError
 from fascraft.module_dependencies import dependency_graph
 
-# Initialize rich console
-console = Console()
-
 
 def is_fastapi_project(project_path: Path) -> bool:
     """Check if the given path is a FastAPI project."""
@@ -4,15 +4,12 @@ from pathlib import Path
 
 import typer
 from jinja2 import Environment, PackageLoader, select_autoescape
-from rich.console import Console
 from rich.text import Text
 
+from fascraft.console import console
 from fascraft.module_dependencies import dependency_analyzer, dependency_graph
 from fascraft.template_registry import template_registry
 
-# Initialize rich console
-console = Console()
-
 
 def is_fastapi_project(project_path: Path) -> bool:
     """Check if the given path is a FastAPI project."""
@@ -3,12 +3,10 @@
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-# Initialize rich console
-console = Console()
+from fascraft.console import console
 
 
 def testing_utils_help() -> None:
@@ -3,14 +3,12 @@
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 
-from .generate import is_fastapi_project
+from fascraft.console import console
 
-# Initialize rich console
-console = Console()
+from .generate import is_fastapi_project
 
 
 def list_modules(
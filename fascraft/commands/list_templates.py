@@ -1,16 +1,13 @@
 """Command for listing available module templates."""
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from fascraft.console import console
 from fascraft.template_registry import template_registry
 
-# Initialize rich console
-console = Console()
-
 
 def list_templates(
     category: str | None = typer.Option(None, help="Filter templates by category"),
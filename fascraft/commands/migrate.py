@@ -4,12 +4,10 @@ import shutil
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
 
-# Initialize rich console
-console = Console()
+from fascraft.console import console
 
 
 def migrate_project(
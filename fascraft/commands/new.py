@@ -1,11 +1,25 @@
 """Command for creating a new FastAPI project."""
 
+import os
+import shutil
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from importlib import resources
 from pathlib import Path
+from typing import BinaryIO
 
 import typer
-from jinja2 import Environment, PackageLoader, select_autoescape
-from rich.console import Console
+from jinja2 import (
+    DictLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    TemplateNotFound,
+    TemplateSyntaxError,
+    select_autoescape,
+)
+from rich.console import Group
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Confirm, Prompt
@@ -13,6 +27,7 @@ from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
+from fascraft.console import console
 from fascraft.exceptions import (
     CorruptedTemplateError,
     DiskSpaceError,
@@ -32,8 +47,137 @@ from fascraft.validation import (
     validate_project_path,
 )
 
-# Initialize rich console
-console = Console(width=None, soft_wrap=False)
+# Templates are independent, so their file writes can overlap on a few threads
+TEMPLATE_RENDER_WORKERS = 8
+
+# Template counts at or below this render without a progress spinner
+PROGRESS_TEMPLATE_THRESHOLD = 32
+
+# Project subdirectories, parents before children, so each needs one mkdir
+PROJECT_DIRECTORIES = ("config", "routers", "database", ".github", ".github/workflows")
+
+# Every template in a new project, as (template name, output path) pairs
+ALL_TEMPLATES: tuple[tuple[str, str], ...] = (
+    ("__init__.py.jinja2", "__init__.py"),
+    ("main.py.jinja2", "main.py"),
+    ("pyproject.toml.jinja2", "pyproject.toml"),
+    ("README.md.jinja2", "README.md"),
+    ("env.jinja2", ".env"),
+    ("env.sample.jinja2", ".env.sample"),
+    ("requirements.txt.jinja2", "requirements.txt"),
+    ("requirements.dev.txt.jinja2", "requirements.dev.txt"),
+    ("requirements.prod.txt.jinja2", "requirements.prod.txt"),
+    ("config/__init__.py.jinja2", "config/__init__.py"),
+    ("config/settings.py.jinja2", "config/settings.py"),
+    ("config/database.py.jinja2", "config/database.py"),
+    ("config/exceptions.py.jinja2", "config/exceptions.py"),
+    ("config/middleware.py.jinja2", "config/middleware.py"),
+    (".gitignore.jinja2", ".gitignore"),
+    ("routers/__init__.py.jinja2", "routers/__init__.py"),
+    ("routers/base.py.jinja2", "routers/base.py"),
+    ("fascraft.toml.jinja2", "fascraft.toml"),
+    # Docker templates
+    ("Dockerfile.jinja2", "Dockerfile"),
+    ("docker-compose.yml.jinja2", "docker-compose.yml"),
+    (".dockerignore.jinja2", ".dockerignore"),
+    ("database/init.sql.jinja2", "database/init.sql"),
+    # CI/CD templates
+    (".github/workflows/ci.yml.jinja2", ".github/workflows/ci.yml"),
+    (
+        ".github/workflows/dependency-update.yml.jinja2",
+        ".github/workflows/dependency-update.yml",
+    ),
+    (".gitlab-ci.yml.jinja2", ".gitlab-ci.yml"),
+    (".pre-commit-config.yaml.jinja2", ".pre-commit-config.yaml"),
+)
+
+# Templates without any Jinja syntax; their output is the source itself, so
+# they are copied without going through Jinja
+STATIC_TEMPLATES = frozenset(
+    {
+        "env.jinja2",
+        "requirements.txt.jinja2",
+        "requirements.dev.txt.jinja2",
+        "requirements.prod.txt.jinja2",
+        ".dockerignore.jinja2",
+        ".pre-commit-config.yaml.jinja2",
+    }
+)
+
+# Outputs rendered when full rendering fails and the project is degraded
+ESSENTIAL_OUTPUTS = frozenset(
+    {
+        "main.py",
+        "pyproject.toml",
+        "requirements.txt",
+        "__init__.py",
+        "README.md",
+        "fascraft.toml",
+        ".env.sample",
+        ".gitignore",
+        ".dockerignore",
+        "config/__init__.py",
+        "config/settings.py",
+        "routers/__init__.py",
+        "routers/base.py",
+    }
+)
+ESSENTIAL_TEMPLATES = tuple(
+    template for template in ALL_TEMPLATES if template[1] in ESSENTIAL_OUTPUTS
+)
+
+# Rendered files are written as raw bytes; O_BINARY only exists on Windows
+FILE_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+# Generated files larger than this many bytes are not read back to validate
+VALIDATION_READ_THRESHOLD = 64
+
+# Location of the new-project templates inside the fascraft package
+TEMPLATE_PACKAGE_PATH = ("templates", "new_project")
+
+
+def get_template_cache_dir() -> Path:
+    """Get the user cache directory that keeps compiled template bytecode."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "fascraft" / "jinja"
+
+
+def get_bytecode_cache() -> FileSystemBytecodeCache | None:
+    """Get the on-disk template bytecode cache, or None if it can't be created."""
+    try:
+        # Path.home() raises RuntimeError when no home directory can be found
+        cache_dir = get_template_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return FileSystemBytecodeCache(str(cache_dir), pattern="%s.cache")
+    except (OSError, RuntimeError):
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_template_sources() -> dict[str, str]:
+    """Read every new-project template once, keyed by its relative path."""
+    sources = {}
+    pending = [(resources.files("fascraft").joinpath(*TEMPLATE_PACKAGE_PATH), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        for entry in directory.iterdir():
+            name = f"{prefix}{entry.name}"
+            if entry.is_dir():
+                pending.append((entry, f"{name}/"))
+            elif entry.name.endswith(".jinja2"):
+                sources[name] = entry.read_text(encoding="utf-8")
+    return sources
+
+
+@lru_cache(maxsize=1)
+def get_template_environment() -> Environment:
+    """Get the shared Jinja2 environment, so each template compiles only once."""
+    return Environment(
+        loader=DictLoader(get_template_sources()),
+        autoescape=select_autoescape(),
+        auto_reload=False,
+        bytecode_cache=get_bytecode_cache(),
+    )
 
 
 def create_new_project(
@@ -206,8 +350,6 @@ def confirm_project_creation(project_path: Path, project_name: str) -> bool:
 
     # Show disk space info
     try:
-        import shutil
-
         total, used, free = shutil.disk_usage(project_path.parent)
         free_gb = free // (1024**3)
         console.print(f"💾 [bold blue]Available disk space: {free_gb} GB[/bold blue]")
@@ -266,11 +408,7 @@ def perform_dry_run(project_path: Path, project_name: str) -> None:
 
     # Preview main.py
     try:
-        env = Environment(
-            loader=PackageLoader("fascraft", "templates/new_project"),
-            autoescape=select_autoescape(),
-        )
-        template = env.get_template("main.py.jinja2")
+        template = get_template_environment().get_template("main.py.jinja2")
         main_content = template.render(
             project_name=project_name, author_name="Lutor Iyornumbe"
         )
@@ -303,12 +441,10 @@ def create_project_structure(project_path: Path, project_name: str) -> None:
         # Ensure project root exists
         project_path.mkdir(parents=True, exist_ok=True)
 
-        # Create main directories (DDA approach - only essential folders)
-        (project_path / "config").mkdir(parents=True, exist_ok=True)
-        (project_path / "routers").mkdir(parents=True, exist_ok=True)
-
-        # Create CI/CD directory structure
-        (project_path / ".github" / "workflows").mkdir(parents=True, exist_ok=True)
+        # Create every directory the templates write into (DDA approach -
+        # only essential folders), once each
+        for directory in PROJECT_DIRECTORIES:
+            (project_path / directory).mkdir(exist_ok=True)
 
         console.print("📁 Created project directory structure", style="bold green")
 
@@ -327,39 +463,14 @@ def render_project_templates_with_progress(
     project_path: Path, project_name: str
 ) -> None:
     """Render all project templates with progress tracking."""
-    templates = [
-        ("__init__.py.jinja2", "__init__.py"),
-        ("main.py.jinja2", "main.py"),
-        ("pyproject.toml.jinja2", "pyproject.toml"),
-        ("README.md.jinja2", "README.md"),
-        ("env.jinja2", ".env"),
-        ("env.sample.jinja2", ".env.sample"),
-        ("requirements.txt.jinja2", "requirements.txt"),
-        ("requirements.dev.txt.jinja2", "requirements.dev.txt"),
-        ("requirements.prod.txt.jinja2", "requirements.prod.txt"),
-        ("config/__init__.py.jinja2", "config/__init__.py"),
-        ("config/settings.py.jinja2", "config/settings.py"),
-        ("config/database.py.jinja2", "config/database.py"),
-        ("config/exceptions.py.jinja2", "config/exceptions.py"),
-        ("config/middleware.py.jinja2", "config/middleware.py"),
-        (".gitignore.jinja2", ".gitignore"),
-        ("routers/__init__.py.jinja2", "routers/__init__.py"),
-        ("routers/base.py.jinja2", "routers/base.py"),
-        ("fascraft.toml.jinja2", "fascraft.toml"),
-        # Docker templates
-        ("Dockerfile.jinja2", "Dockerfile"),
-        ("docker-compose.yml.jinja2", "docker-compose.yml"),
-        (".dockerignore.jinja2", ".dockerignore"),
-        ("database/init.sql.jinja2", "database/init.sql"),
-        # CI/CD templates
-        (".github/workflows/ci.yml.jinja2", ".github/workflows/ci.yml"),
-        (
-            ".github/workflows/dependency-update.yml.jinja2",
-            ".github/workflows/dependency-update.yml",
-        ),
-        (".gitlab-ci.yml.jinja2", ".gitlab-ci.yml"),
-        (".pre-commit-config.yaml.jinja2", ".pre-commit-config.yaml"),
-    ]
+    templates = ALL_TEMPLATES
+
+    # Small template sets render faster than a spinner can refresh, and
+    # non-terminal output gains nothing from one
+    if len(templates) <= PROGRESS_TEMPLATE_THRESHOLD or not console.is_terminal:
+        render_templates_concurrently(project_path, project_name, templates)
+        console.print(f"✅ Rendered {len(templates)} templates", style="green")
+        return
 
     with Progress(
         SpinnerColumn(),
@@ -367,27 +478,56 @@ def render_project_templates_with_progress(
         console=console,
     ) as progress:
         task = progress.add_task("Rendering templates...", total=len(templates))
+        try:
+            render_templates_concurrently(
+                project_path,
+                project_name,
+                templates,
+                on_rendered=lambda: progress.advance(task),
+            )
+        except TemplateRenderError:
+            progress.stop()
+            raise
 
-        for template_name, output_name in templates:
+
+def render_templates_concurrently(
+    project_path: Path,
+    project_name: str,
+    templates: tuple[tuple[str, str], ...],
+    on_rendered: Callable[[], None] | None = None,
+) -> None:
+    """Render templates on a thread pool, calling on_rendered after each one."""
+    with ThreadPoolExecutor(max_workers=TEMPLATE_RENDER_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                render_single_template,
+                project_path,
+                project_name,
+                template_name,
+                output_name,
+            ): template_name
+            for template_name, output_name in templates
+        }
+        for future in as_completed(futures):
             try:
-                render_single_template(
-                    project_path, project_name, template_name, output_name
-                )
-                progress.advance(task)
+                future.result()
             except Exception as e:
-                progress.stop()
-                raise TemplateRenderError(template_name, str(e)) from e
+                executor.shutdown(cancel_futures=True)
+                raise TemplateRenderError(futures[future], str(e)) from e
+            if on_rendered is not None:
+                on_rendered()
 
 
 def display_success_message(project_path: Path, project_name: str) -> None:
     """Display success message and next steps."""
-    success_text = Text()
-    success_text.append("🎉 ", style="bold green")
-    success_text.append("Successfully created new project ", style="bold white")
-    success_text.append(f"'{project_name}' ", style="bold cyan")
-    success_text.append("at ", style="white")
-    success_text.append(f"{project_path}", style="bold blue")
-    success_text.append(".", style="white")
+    success_text = Text.assemble(
+        ("🎉 ", "bold green"),
+        ("Successfully created new project ", "bold white"),
+        (f"'{project_name}' ", "bold cyan"),
+        ("at ", "white"),
+        (f"{project_path}", "bold blue"),
+        (".", "white"),
+    )
     console.print(success_text)
 
     # Display next steps
@@ -402,8 +542,6 @@ def display_success_message(project_path: Path, project_name: str) -> None:
 
 def display_next_steps(project_path: Path, project_name: str) -> None:
     """Display next steps for the user."""
-    console.print("\n⚡ [bold yellow]Next Steps:[/bold yellow]")
-
     # Create a table for next steps
     steps_table = Table(show_header=True, header_style="bold green")
     steps_table.add_column("Step", style="cyan", width=20)
@@ -430,25 +568,36 @@ def display_next_steps(project_path: Path, project_name: str) -> None:
         "Interactive API documentation",
     )
 
-    console.print(steps_table)
-
-    # Additional guidance
-    console.print("\n🛠️ [bold blue]Development Commands:[/bold blue]")
-    console.print("  • [cyan]pytest[/cyan] - Run tests")
-    console.print("  • [cyan]black .[/cyan] - Format code")
-    console.print("  • [cyan]ruff check .[/cyan] - Lint code")
-
-    console.print("\n🐳 [bold blue]Docker Commands:[/bold blue]")
-    console.print("  • [cyan]docker-compose up --build[/cyan] - Run with Docker")
     console.print(
-        "  • [cyan]docker-compose --profile production up[/cyan] - Production mode"
+        Group(
+            Text.from_markup("\n⚡ [bold yellow]Next Steps:[/bold yellow]"),
+            steps_table,
+            get_development_commands_group(),
+        )
     )
 
 
-def display_project_features() -> None:
-    """Display information about project features."""
-    console.print("\n🔧 [bold blue]Project Features:[/bold blue]")
+@lru_cache(maxsize=1)
+def get_development_commands_group() -> Group:
+    """Build the static development and Docker command hints once."""
+    return Group(
+        Text.from_markup("\n🛠️ [bold blue]Development Commands:[/bold blue]"),
+        Text.from_markup("  • [cyan]pytest[/cyan] - Run tests"),
+        Text.from_markup("  • [cyan]black .[/cyan] - Format code"),
+        Text.from_markup("  • [cyan]ruff check .[/cyan] - Lint code"),
+        Text.from_markup("\n🐳 [bold blue]Docker Commands:[/bold blue]"),
+        Text.from_markup(
+            "  • [cyan]docker-compose up --build[/cyan] - Run with Docker"
+        ),
+        Text.from_markup(
+            "  • [cyan]docker-compose --profile production up[/cyan] - Production mode"
+        ),
+    )
+
 
+@lru_cache(maxsize=1)
+def get_project_features_group() -> Group:
+    """Build the static project features table once."""
     features_table = Table(show_header=True, header_style="bold blue")
     features_table.add_column("Feature", style="cyan", width=20)
     features_table.add_column("Description", style="white")
@@ -466,40 +615,64 @@ def display_project_features() -> None:
     features_table.add_row("🧪 Testing", "Pytest setup with coverage support")
     features_table.add_row("📝 Documentation", "Auto-generated API docs with FastAPI")
 
-    console.print(features_table)
+    return Group(
+        Text.from_markup("\n🔧 [bold blue]Project Features:[/bold blue]"),
+        features_table,
+    )
 
 
-def display_best_wishes() -> None:
-    """Display encouraging best wishes message."""
-    console.print("\n🚀 [bold green]Best wishes on your FastAPI journey![/bold green]")
-    console.print("Your project is set up for success!", style="bold cyan")
+@lru_cache(maxsize=1)
+def get_best_wishes_group() -> Group:
+    """Build the static closing message once."""
+    return Group(
+        Text.from_markup(
+            "\n🚀 [bold green]Best wishes on your FastAPI journey![/bold green]"
+        ),
+        Text("Your project is set up for success!", style="bold cyan"),
+        Text.from_markup("\n💡 [bold blue]Pro Tips:[/bold blue]"),
+        Text.from_markup(
+            "  • Use [cyan]fascraft generate <module>[/cyan] to add new features"
+        ),
+        Text.from_markup(
+            "  • Use [cyan]fascraft analyze[/cyan] to get project insights"
+        ),
+        Text.from_markup("  • Check [cyan]docs/[/cyan] for detailed guides"),
+        Text("  • Join our community for support!"),
+        Text.from_markup("\n✨ [bold yellow]Happy coding![/bold yellow]"),
+        Text(
+            "Your modular architecture will make future you very grateful!",
+            style="bold cyan",
+        ),
+    )
 
-    console.print("\n💡 [bold blue]Pro Tips:[/bold blue]")
-    console.print("  • Use [cyan]fascraft generate <module>[/cyan] to add new features")
-    console.print("  • Use [cyan]fascraft analyze[/cyan] to get project insights")
-    console.print("  • Check [cyan]docs/[/cyan] for detailed guides")
-    console.print("  • Join our community for support!")
 
-    console.print("\n✨ [bold yellow]Happy coding![/bold yellow]")
-    console.print(
-        "Your modular architecture will make future you very grateful!",
-        style="bold cyan",
-    )
+def display_project_features() -> None:
+    """Display information about project features."""
+    console.print(get_project_features_group())
+
+
+def display_best_wishes() -> None:
+    """Display encouraging best wishes message."""
+    console.print(get_best_wishes_group())
 
 
 def display_error_message(error: FasCraftError) -> None:
     """Display user-friendly error message with recovery guidance."""
-    error_text = Text(no_wrap=True)
-    error_text.append("❌ ", style="bold red")
-    error_text.append("Error: ", style="bold red")
-    error_text.append(error.message, style="white")
+    error_text = Text.assemble(
+        ("❌ ", "bold red"),
+        ("Error: ", "bold red"),
+        (error.message, "white"),
+        no_wrap=True,
+    )
     console.print(error_text, soft_wrap=False)
 
     if error.suggestion:
-        suggestion_text = Text(no_wrap=True)
-        suggestion_text.append("💡 ", style="bold yellow")
-        suggestion_text.append("Suggestion: ", style="bold yellow")
-        suggestion_text.append(error.suggestion, style="white")
+        suggestion_text = Text.assemble(
+            ("💡 ", "bold yellow"),
+            ("Suggestion: ", "bold yellow"),
+            (error.suggestion, "white"),
+            no_wrap=True,
+        )
         console.print(suggestion_text, soft_wrap=False)
 
     # Add specific error recovery guidance
@@ -613,7 +786,7 @@ def display_template_error_guidance() -> None:
         "pip uninstall fascraft && pip install fascraft",
     )
     guidance_table.add_row(
-        "2. Clear Cache", "Remove template cache", "rm -rf ~/.fascraft/templates/"
+        "2. Clear Cache", "Remove template cache", "rm -rf ~/.cache/fascraft/"
     )
     guidance_table.add_row(
         "3. Check Version", "Verify FasCraft version", "poetry run fascraft --version"
@@ -734,19 +907,17 @@ def display_general_error_guidance() -> None:
 
 def display_unexpected_error(error: Exception) -> None:
     """Display unexpected error message with recovery guidance."""
-    error_text = Text()
-    error_text.append("💥 ", style="bold red")
-    error_text.append("Unexpected error: ", style="bold red")
-    error_text.append(str(error), style="white")
+    error_text = Text.assemble(
+        ("💥 ", "bold red"),
+        ("Unexpected error: ", "bold red"),
+        (str(error), "white"),
+    )
     console.print(error_text)
 
-    suggestion_text = Text()
-    suggestion_text.append("🆘 ", style="bold yellow")
-    suggestion_text.append(
-        "This is unexpected. Please report this bug at: ", style="white"
-    )
-    suggestion_text.append(
-        "https://github.com/LexxLuey/fascraft/issues", style="bold cyan"
+    suggestion_text = Text.assemble(
+        ("🆘 ", "bold yellow"),
+        ("This is unexpected. Please report this bug at: ", "white"),
+        ("https://github.com/LexxLuey/fascraft/issues", "bold cyan"),
     )
     console.print(suggestion_text)
 
@@ -806,8 +977,8 @@ def create_project_with_rollback(project_path: Path, project_name: str) -> None:
             validate_file_system_writable(project_path.parent)
             validate_disk_space(project_path.parent, required_space_mb=20)
 
-        # Create backup of existing directory if it exists
-        if project_path.exists():
+        # Back up an existing directory, unless there is nothing in it to keep
+        if project_path.is_dir() and any(project_path.iterdir()):
             backup_path = create_backup_directory(project_path)
 
         # Create project structure
@@ -834,6 +1005,10 @@ def create_project_with_rollback(project_path: Path, project_name: str) -> None:
         rollback_project_creation(project_path, backup_path, created_files)
         raise e from e
 
+    # The backup was moved aside, so return whatever the templates didn't replace
+    if backup_path:
+        restore_untouched_entries(backup_path, project_path)
+
 
 def create_backup_directory(path: Path) -> Path:
     """Create backup of existing directory."""
@@ -842,9 +1017,12 @@ def create_backup_directory(path: Path) -> Path:
     backup_path = path.parent / backup_name
 
     try:
-        import shutil
-
-        shutil.copytree(path, backup_path)
+        # The project is about to be regenerated, so move it aside rather
+        # than copying it; a sibling path keeps the rename on one filesystem
+        try:
+            path.rename(backup_path)
+        except OSError:
+            shutil.copytree(path, backup_path, copy_function=shutil.copy2)
         console.print(f"💾 Created backup at: {backup_path}", style="green")
         return backup_path
     except Exception as e:
@@ -852,6 +1030,36 @@ def create_backup_directory(path: Path) -> Path:
         return None
 
 
+def restore_untouched_entries(backup_path: Path, project_path: Path) -> None:
+    """Move backed-up entries the new project didn't generate back into it.
+
+    Files the templates overwrote stay in the backup; everything else, such as
+    .git, virtual environments or data files, ends up where it was before.
+    """
+    try:
+        move_missing_entries(backup_path, project_path)
+    except Exception as e:
+        console.print(
+            f"⚠️ Warning: Some files remain in the backup at {backup_path}: {e}",
+            style="yellow",
+        )
+
+
+def move_missing_entries(source: Path, target: Path) -> None:
+    """Move entries of source that target lacks, merging shared directories."""
+    with os.scandir(source) as entries:
+        for entry in entries:
+            destination = target / entry.name
+            if not os.path.lexists(destination):
+                os.replace(entry.path, destination)
+            elif (
+                entry.is_dir(follow_symlinks=False)
+                and destination.is_dir()
+                and not destination.is_symlink()
+            ):
+                move_missing_entries(Path(entry.path), destination)
+
+
 def rollback_project_creation(
     project_path: Path, backup_path: Path, created_files: list
 ) -> None:
@@ -859,16 +1067,15 @@ def rollback_project_creation(
     try:
         # Remove created project directory
         if project_path.exists():
-            import shutil
-
             shutil.rmtree(project_path)
             console.print("🗑️ Removed failed project directory", style="yellow")
 
         # Restore from backup if available
         if backup_path and backup_path.exists():
-            import shutil
-
-            shutil.copytree(backup_path, project_path)
+            try:
+                backup_path.rename(project_path)
+            except OSError:
+                shutil.copytree(backup_path, project_path)
             console.print("🔄 Restored from backup", style="green")
 
     except Exception as e:
@@ -920,23 +1127,7 @@ def create_minimal_structure(project_path: Path, project_name: str) -> None:
 
 def render_essential_templates(project_path: Path, project_name: str) -> None:
     """Render only essential templates when full rendering fails."""
-    essential_templates = [
-        ("main.py.jinja2", "main.py"),
-        ("pyproject.toml.jinja2", "pyproject.toml"),
-        ("requirements.txt.jinja2", "requirements.txt"),
-        ("__init__.py.jinja2", "__init__.py"),
-        ("README.md.jinja2", "README.md"),
-        ("fascraft.toml.jinja2", "fascraft.toml"),
-        ("env.jinja2", ".env.sample"),
-        (".gitignore.jinja2", ".gitignore"),
-        (".dockerignore.jinja2", ".dockerignore"),
-        ("config/__init__.py.jinja2", "config/__init__.py"),
-        ("config/settings.py.jinja2", "config/settings.py"),
-        ("routers/__init__.py.jinja2", "routers/__init__.py"),
-        ("routers/base.py.jinja2", "routers/base.py"),
-    ]
-
-    for template_name, output_name in essential_templates:
+    for template_name, output_name in ESSENTIAL_TEMPLATES:
         try:
             render_single_template(
                 project_path, project_name, template_name, output_name
@@ -956,21 +1147,35 @@ def display_partial_success_warnings(warnings: list) -> None:
 def validate_generated_project(project_path: Path) -> None:
     """Validate that the generated project is valid."""
     essential_files = ["main.py", "pyproject.toml"]
+    # Reading every file is only worth it when debugging; otherwise the
+    # size says enough about files this command has just written
+    deep_validate = os.environ.get("FASCRAFT_DEBUG") == "1"
 
     for file_name in essential_files:
         file_path = project_path / file_name
-        if not file_path.exists():
-            raise TemplateError(f"Essential file {file_name} was not generated")
+        try:
+            size = file_path.stat().st_size
+        except FileNotFoundError as e:
+            raise TemplateError(f"Essential file {file_name} was not generated") from e
+        except OSError as e:
+            raise TemplateError(
+                f"Failed to read generated file {file_name}: {str(e)}"
+            ) from e
 
-        # Check if file has content
+        if size == 0:
+            raise TemplateError(f"Generated file {file_name} is empty")
+        if not deep_validate and size > VALIDATION_READ_THRESHOLD:
+            continue
+
+        # Small files could still be whitespace only, so check their content
         try:
             content = file_path.read_text()
-            if not content.strip():
-                raise TemplateError(f"Generated file {file_name} is empty")
         except Exception as e:
             raise TemplateError(
                 f"Failed to read generated file {file_name}: {str(e)}"
             ) from e
+        if not content.strip():
+            raise TemplateError(f"Generated file {file_name} is empty")
 
 
 def render_single_template(
@@ -978,29 +1183,58 @@ def render_single_template(
 ) -> None:
     """Render a single template file."""
     try:
-        # Set up Jinja2 environment
-        env = Environment(
-            loader=PackageLoader("fascraft", "templates/new_project"),
-            autoescape=select_autoescape(),
-        )
-
-        # Load and render template
-        template = env.get_template(template_name)
-        content = template.render(
-            project_name=project_name, author_name="Lutor Iyornumbe"
-        )
+        if template_name in STATIC_TEMPLATES:
+            chunks = (read_static_template(template_name),)
+        else:
+            # Stream the render so the output is never held as one string
+            template = get_template_environment().get_template(template_name)
+            chunks = (
+                chunk.encode("utf-8")
+                for chunk in template.generate(
+                    project_name=project_name, author_name="Lutor Iyornumbe"
+                )
+            )
 
-        # Ensure output directory exists
+        # Write rendered content into a sibling temp file and swap it in once
+        # complete, so a render that fails midway leaves no partial output.
+        # create_project_structure normally made the directory already, so
+        # only create it when the open says otherwise
         output_path = project_path / output_name
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = output_path.with_name(f".{output_path.name}.tmp")
+        try:
+            output_file = open_output_file(temp_path)
+        except FileNotFoundError:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_file = open_output_file(temp_path)
+        try:
+            with output_file:
+                output_file.writelines(chunks)
+            os.replace(temp_path, output_path)
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    except TemplateNotFound as e:
+        raise TemplateNotFoundError(template_name, "templates/new_project") from e
+    except TemplateSyntaxError as e:
+        raise CorruptedTemplateError(template_name, str(e)) from e
+    except Exception as e:
+        raise TemplateRenderError(template_name, str(e)) from e
 
-        # Write rendered content
-        output_path.write_text(content, encoding="utf-8")
 
-    except Exception as e:
-        if "No such file or directory" in str(e):
-            raise TemplateNotFoundError(template_name, "templates/new_project") from e
-        elif "Template syntax error" in str(e) or "Template error" in str(e):
-            raise CorruptedTemplateError(template_name, str(e)) from e
-        else:
-            raise TemplateRenderError(template_name, str(e)) from e
+def read_static_template(template_name: str) -> bytes:
+    """Read a Jinja-free template as the bytes Jinja would have rendered."""
+    source = get_template_sources().get(template_name)
+    if source is None:
+        raise TemplateNotFound(template_name)
+    # Jinja normalizes newlines and drops a single trailing newline
+    output = source.replace("\r\n", "\n").replace("\r", "\n")
+    if output.endswith("\n"):
+        output = output[:-1]
+    return output.encode("utf-8")
+
+
+def open_output_file(path: Path) -> BinaryIO:
+    """Open a file for binary writing with raw os flags, bypassing text I/O."""
+    fd = os.open(path, FILE_WRITE_FLAGS, 0o644)
+    return open(fd, "wb")
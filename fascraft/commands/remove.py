@@ -4,13 +4,11 @@ import shutil
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from rich.text import Text
 
-from .generate import is_fastapi_project
+from fascraft.console import console
 
-# Initialize rich console
-console = Console()
+from .generate import is_fastapi_project
 
 
 def remove_module(
@@ -4,13 +4,11 @@ from pathlib import Path
 
 import typer
 from jinja2 import Environment, PackageLoader, select_autoescape
-from rich.console import Console
 from rich.text import Text
 
-from .generate import is_fastapi_project
+from fascraft.console import console
 
-# Initialize rich console
-console = Console()
+from .generate import is_fastapi_project
 
 
 def update_module(
@@ -0,0 +1,6 @@
+"""Shared Rich console for FasCraft output."""
+
+from rich.console import Console
+
+# One console per process, imported by the CLI and every command module
+console = Console(width=None, soft_wrap=False)
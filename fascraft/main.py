@@ -1,54 +1,80 @@
 """Main FasCraft CLI application."""
 
+import importlib
+
 import typer
-from rich.console import Console
 from rich.text import Text
+from typer.core import TyperGroup
 
-from fascraft.commands import (
-    analyze,
-    analyze_dependencies,
-    ci_cd,
-    config,
-    dependencies,
-    deploy,
-    dockerize,
-    docs,
-    environment,
-)
-from fascraft.commands import generate as generate_cmd
-from fascraft.commands import generate_test
-from fascraft.commands import list as list_cmd
-from fascraft.commands import list_templates, migrate, new
-from fascraft.commands import remove as remove_cmd
-from fascraft.commands import update as update_cmd
+from fascraft.console import console
+
+# Subcommands as name -> "module:attribute", imported only when first used.
+# Plain commands are listed ahead of the eagerly defined ones and command
+# groups after them, matching the order of the top-level help listing
+LAZY_COMMANDS = {
+    "new": "new:create_new_project",
+    "generate": "generate:generate_module",
+    "list": "list:list_modules",
+    "remove": "remove:remove_module",
+    "update": "update:update_module",
+    "analyze": "analyze:analyze_project",
+    "migrate": "migrate:migrate_project",
+    "config": "config:manage_config",
+    "list-templates": "list_templates:list_templates",
+    "analyze-dependencies": "analyze_dependencies:analyze_dependencies",
+    "test": "generate_test:generate_test",
+    "testing-utils": "generate_test:testing_utils_help",
+    "dockerize": "dockerize:add_docker",
+}
+LAZY_GROUPS = {
+    "dependencies": "dependencies:dependencies_app",
+    "docs": "docs:docs_app",
+    "ci-cd": "ci_cd:app",
+    "deploy": "deploy:app",
+    "environment": "environment:app",
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports a subcommand's module only when it is used."""
+
+    def list_commands(self, ctx):
+        # Resolved lazy commands are also registered on the group itself
+        eager = [
+            name
+            for name in super().list_commands(ctx)
+            if name not in LAZY_COMMANDS and name not in LAZY_GROUPS
+        ]
+        return [*LAZY_COMMANDS, *eager, *LAZY_GROUPS]
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.commands or (
+            cmd_name not in LAZY_COMMANDS and cmd_name not in LAZY_GROUPS
+        ):
+            return super().get_command(ctx, cmd_name)
+
+        if cmd_name in LAZY_GROUPS:
+            module_name, attribute = LAZY_GROUPS[cmd_name].split(":")
+            module = importlib.import_module(f"fascraft.commands.{module_name}")
+            command = typer.main.get_group(getattr(module, attribute))
+        else:
+            module_name, attribute = LAZY_COMMANDS[cmd_name].split(":")
+            module = importlib.import_module(f"fascraft.commands.{module_name}")
+            # No completion options: they belong to the top-level app only
+            wrapper = typer.Typer(add_completion=False)
+            wrapper.command(name=cmd_name)(getattr(module, attribute))
+            command = typer.main.get_command(wrapper)
+        command.name = cmd_name
+        self.commands[cmd_name] = command
+        return command
 
-# Initialize rich console
-console = Console()
 
 app = typer.Typer(
-    help="FasCraft CLI for generating modular FastAPI projects.", name="fascraft"
+    help="FasCraft CLI for generating modular FastAPI projects.",
+    name="fascraft",
+    cls=LazyTyperGroup,
 )
 
-# Register commands
-app.command(name="new")(new.create_new_project)
-app.command(name="generate")(generate_cmd.generate_module)
-app.command(name="list")(list_cmd.list_modules)
-app.command(name="remove")(remove_cmd.remove_module)
-app.command(name="update")(update_cmd.update_module)
-app.command(name="analyze")(analyze.analyze_project)
-app.command(name="migrate")(migrate.migrate_project)
-app.command(name="config")(config.manage_config)
-app.command(name="list-templates")(list_templates.list_templates)
-app.command(name="analyze-dependencies")(analyze_dependencies.analyze_dependencies)
-app.add_typer(dependencies.dependencies_app, name="dependencies")
-app.command(name="test")(generate_test.generate_test)
-app.command(name="testing-utils")(generate_test.testing_utils_help)
-app.add_typer(docs.docs_app, name="docs")
-app.command(name="dockerize")(dockerize.add_docker)
-app.add_typer(ci_cd.app, name="ci-cd")
-app.add_typer(deploy.app, name="deploy")
-app.add_typer(environment.app, name="environment")
-
 
 @app.command()
 def hello(name: str = typer.Argument("World", help="Name to greet")):
@@ -6,13 +6,23 @@ except ImportError:
     # Fallback for Python < 3.11
     import tomli as tomllib
 
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
-    """Get the current FasCraft version from pyproject.toml."""
+    """Get the current FasCraft version, resolved once per process."""
     try:
-        # Try to read from pyproject.toml first
+        # Installed package metadata is a cheap lookup, so try it first
+        import importlib.metadata
+
+        return importlib.metadata.version("fascraft")
+    except Exception:  # nosec B110 - Intentional fallback, don't expose internal errors
+        pass
+
+    try:
+        # Fall back to pyproject.toml for uninstalled source checkouts
         pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
         if pyproject_path.exists():
             with open(pyproject_path, "rb") as f:
@@ -21,14 +31,6 @@ def get_version() -> str:
     except (KeyError, FileNotFoundError, OSError):
         pass
 
-    try:
-        # Fallback to package metadata (for installed packages)
-        import importlib.metadata
-
-        return importlib.metadata.version("fascraft")
-    except Exception:  # nosec B110 - Intentional fallback, don't expose internal errors
-        pass
-
     # Final fallback - return unknown
     return "unknown"
 
@@ -42,5 +44,9 @@ def get_version_info() -> dict:
     }
 
 
-# For backward compatibility and direct import
-__version__ = get_version()
+def __getattr__(name: str):
+    """Resolve __version__ on first access rather than at import."""
+    # Kept for backward compatibility with `from fascraft.version import __version__`
+    if name == "__version__":
+        return get_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,35 +1,37 @@
 """Tests for the analyze command functionality."""
 
-from unittest.mock import patch
+from unittest.mock import mock_open, patch
 
 import pytest
 import typer
 
 from fascraft.commands.analyze import (
+    FASTAPI_PROBE_SIZE,
+    MainPyAnalysis,
+    ProjectFileCache,
     analyze_changelog_quality,
     analyze_config_directory,
     analyze_documentation_quality,
     analyze_main_py,
     analyze_project,
     analyze_project_structure,
+    analyze_projects,
     analyze_readme_quality,
     display_analysis_results,
     extract_version_info,
+    find_pyproject_version,
     is_fastapi_project,
     provide_recommendations,
 )
+from fascraft.console import console
 
 
 class TestIsFastApiProject:
     """Test the is_fastapi_project function."""
 
-    def test_is_fastapi_project_valid_main_py(self, tmp_path):
+    def test_is_fastapi_project_valid_main_py(self, fastapi_project):
         """Test that a valid FastAPI project with main.py is correctly identified."""
-        # Create main.py with FastAPI content
-        main_py = tmp_path / "main.py"
-        main_py.write_text("from fastapi import FastAPI\napp = FastAPI()")
-
-        assert is_fastapi_project(tmp_path) is True
+        assert is_fastapi_project(fastapi_project) is True
 
     def test_is_fastapi_project_valid_pyproject_toml(self, tmp_path):
         """Test that a valid FastAPI project with pyproject.toml is correctly identified."""
@@ -49,6 +51,97 @@ class TestIsFastApiProject:
         main_py.write_text("print('Hello World')")
         assert is_fastapi_project(tmp_path) is False
 
+    def test_is_fastapi_project_marker_past_probe(self, tmp_path):
+        """Test that a marker beyond the probed head of main.py is still found."""
+        main_py = tmp_path / "main.py"
+        main_py.write_text("#" * 5000 + "\nfrom fastapi import FastAPI\n")
+
+        assert is_fastapi_project(tmp_path) is True
+
+    def test_is_fastapi_project_pyproject_case_insensitive(self, tmp_path):
+        """Test that the pyproject.toml dependency is matched in any case."""
+        (tmp_path / "main.py").write_text("print('Hello World')")
+        (tmp_path / "pyproject.toml").write_text('dependencies = ["FastAPI>=0.100"]')
+
+        assert is_fastapi_project(tmp_path) is True
+        assert is_fastapi_project(tmp_path, ProjectFileCache()) is True
+
+    def test_is_fastapi_project_reads_only_head(self, tmp_path):
+        """Test that a match in the head of main.py stops further reading."""
+        main_py = tmp_path / "main.py"
+        main_py.write_text("from fastapi import FastAPI\n" + "#" * 10000)
+
+        with patch("builtins.open", mock_open(read_data=main_py.read_bytes())) as m:
+            assert is_fastapi_project(tmp_path) is True
+
+        m.return_value.read.assert_called_once_with(FASTAPI_PROBE_SIZE)
+
+
+class TestProjectFileCache:
+    """Test the ProjectFileCache class."""
+
+    def test_project_file_cache_reads_once(self, tmp_path):
+        """Test that each file is read from disk only once."""
+        readme = tmp_path / "README.md"
+        readme.write_text("# Title")
+        file_cache = ProjectFileCache()
+
+        assert file_cache.read(readme) == b"# Title"
+        readme.write_text("# Changed")
+        assert file_cache.read(readme) == b"# Title"
+
+    def test_project_file_cache_missing_file(self, tmp_path):
+        """Test that missing files and directories read as None."""
+        (tmp_path / "docs").mkdir()
+        file_cache = ProjectFileCache()
+
+        assert file_cache.read(tmp_path / "missing.md") is None
+        assert file_cache.read(tmp_path / "docs") is None
+
+    def test_analysis_reads_each_file_once(self, tmp_path):
+        """Test that a full structure analysis reads each project file once."""
+        (tmp_path / "main.py").write_text("from fastapi import FastAPI")
+        (tmp_path / "README.md").write_text("# Test Project\nVersion: 1.0.0")
+        (tmp_path / "CHANGELOG.md").write_text("## [1.0.0]\n### Added")
+        (tmp_path / "pyproject.toml").write_text('version = "1.0.0"')
+        file_cache = ProjectFileCache()
+
+        with patch.object(
+            type(tmp_path), "read_bytes", autospec=True, side_effect=lambda p: b""
+        ) as mock_read_bytes:
+            assert is_fastapi_project(tmp_path, file_cache) is False
+            analyze_project_structure(tmp_path, file_cache)
+
+        read_paths = [call.args[0] for call in mock_read_bytes.call_args_list]
+        assert len(read_paths) == len(set(read_paths))
+
+
+class TestAnalyzeProjects:
+    """Test the analyze_projects function."""
+
+    def test_analyze_projects_preserves_order(self, tmp_path):
+        """Test that each project is analyzed and results follow input order."""
+        paths = []
+        for name in ("alpha", "beta", "gamma"):
+            project_path = tmp_path / name
+            project_path.mkdir()
+            (project_path / "main.py").write_text("from fastapi import FastAPI")
+            paths.append(project_path)
+        (paths[1] / "pyproject.toml").write_text("[tool.poetry]")
+
+        results = analyze_projects(paths)
+
+        assert [result["project_name"] for result in results] == [
+            "alpha",
+            "beta",
+            "gamma",
+        ]
+        assert results == [analyze_project_structure(path) for path in paths]
+
+    def test_analyze_projects_empty(self):
+        """Test that no paths yields no results."""
+        assert analyze_projects([]) == []
+
 
 class TestAnalyzeProjectStructure:
     """Test the analyze_project_structure function."""
@@ -85,6 +178,20 @@ class TestAnalyzeProjectStructure:
         assert "products" in analysis["modules"]
         assert len(analysis["modules"]) == 2
 
+    def test_analyze_project_structure_partial_module_and_config_files(self, tmp_path):
+        """Test incomplete modules are not counted and config files are listed."""
+        orders_dir = tmp_path / "orders"
+        orders_dir.mkdir()
+        (orders_dir / "__init__.py").write_text("")
+        (tmp_path / "fascraft.toml").write_text("")
+        (tmp_path / ".env").write_text("")
+
+        analysis = analyze_project_structure(tmp_path)
+
+        assert analysis["modules"] == []
+        assert analysis["structure"]["other_dirs"] == ["orders"]
+        assert analysis["config_files"] == ["fascraft.toml", ".env"]
+
     def test_analyze_project_structure_flat_structure(self, tmp_path):
         """Test detection of flat structure projects."""
         # Create flat structure indicators
@@ -100,6 +207,19 @@ class TestAnalyzeProjectStructure:
             in analysis["suggestions"]
         )
 
+    def test_analyze_project_structure_flat_structure_suggested_once(self, tmp_path):
+        """Test that several layer directories yield a single suggestion."""
+        for name in ("models", "schemas", "services", "routers"):
+            (tmp_path / name).mkdir()
+        (tmp_path / "services.py").write_text("")
+
+        analysis = analyze_project_structure(tmp_path)
+
+        assert analysis["suggestions"] == [
+            "Consider converting to domain-driven architecture"
+        ]
+        assert "other_dirs" not in analysis["structure"]
+
 
 class TestAnalyzeConfigDirectory:
     """Test the analyze_config_directory function."""
@@ -136,6 +256,22 @@ class TestAnalyzeConfigDirectory:
         assert "exceptions.py" not in analysis["files"]
         assert "middleware.py" not in analysis["files"]
 
+    def test_analyze_config_directory_attributes(self, tmp_path):
+        """Test that config findings are readable as attributes and by key."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (config_dir / "settings.py").write_text("# settings")
+
+        analysis = analyze_config_directory(config_dir)
+
+        assert analysis.files == ["settings.py"]
+        assert analysis.has_settings is True
+        assert analysis.has_database is False
+        assert analysis.get("has_database") is False
+        assert analysis.get("missing", "default") == "default"
+        with pytest.raises(KeyError):
+            analysis["missing"]
+
 
 class TestAnalyzeMainPy:
     """Test the analyze_main_py function."""
@@ -178,12 +314,58 @@ app = FastAPI()
         assert analysis["has_router_includes"] is False
         assert analysis["router_count"] == 0
 
+    def test_analyze_main_py_base_router(self, tmp_path):
+        """Test analysis of main.py that includes routers through a base router."""
+        main_py = tmp_path / "main.py"
+        main_py.write_text(
+            "from fastapi import FastAPI\n"
+            "from routers import base_router\n"
+            "app = FastAPI()\n"
+            "app.include_router(base_router)\n"
+            "app.include_router (legacy_router)\n"
+        )
+
+        analysis = analyze_main_py(main_py)
+
+        assert analysis["has_base_router"] is True
+        assert analysis["has_router_includes"] is True
+        assert analysis["router_count"] == 2
+
+    def test_analyze_main_py_crlf_and_non_utf8(self, tmp_path):
+        """Test analysis of main.py with CRLF endings and non-UTF-8 bytes."""
+        main_py = tmp_path / "main.py"
+        main_py.write_bytes(
+            b"# caf\xe9\r\nfrom fastapi import FastAPI\r\n"
+            b"app = FastAPI()\r\napp.include_router(router)\r\n"
+        )
+
+        analysis = analyze_main_py(main_py)
+
+        assert analysis["has_fastapi_import"] is True
+        assert analysis["router_count"] == 1
+        assert analysis["lines"] == 5
+
+    def test_analyze_main_py_returns_record(self, tmp_path):
+        """Test that main.py findings are a slotted record."""
+        main_py = tmp_path / "main.py"
+        main_py.write_text("from fastapi import FastAPI\napp.include_router(r)\n")
+
+        analysis = analyze_main_py(main_py)
+
+        assert analysis == MainPyAnalysis(
+            has_fastapi_import=True,
+            has_router_includes=True,
+            router_count=1,
+            has_base_router=False,
+            lines=3,
+        )
+        assert not hasattr(analysis, "__dict__")
+
 
 class TestDisplayAnalysisResults:
     """Test the display_analysis_results function."""
 
-    @patch("fascraft.commands.analyze.console.print")
-    def test_display_analysis_results(self, mock_print, tmp_path):
+    def test_display_analysis_results(self, console_print):
         """Test that analysis results are displayed correctly."""
         analysis = {
             "project_name": "test-project",
@@ -196,15 +378,32 @@ class TestDisplayAnalysisResults:
 
         display_analysis_results(analysis)
 
-        # Verify that console.print was called multiple times
-        assert mock_print.call_count > 0
+        # Verify that console.print was called
+        assert console_print.calls
+
+    def test_display_analysis_results_single_render(self, console_print_passthrough):
+        """Test that all results are rendered in one print call."""
+        analysis = {
+            "project_name": "test-project",
+            "structure": {"flat_structure": True},
+            "modules": ["customers"],
+            "config_files": [],
+        }
+
+        with console.capture() as capture:
+            display_analysis_results(analysis)
+
+        assert len(console_print_passthrough.calls) == 1
+        output = capture.get()
+        assert "Project Overview" in output
+        assert "Structure Analysis" in output
+        assert "Domain Modules Found: customers" in output
 
 
 class TestProvideRecommendations:
     """Test the provide_recommendations function."""
 
-    @patch("fascraft.commands.analyze.console.print")
-    def test_provide_recommendations(self, mock_print, tmp_path):
+    def test_provide_recommendations(self, console_print):
         """Test that recommendations are provided correctly."""
         analysis = {
             "suggestions": ["Convert to domain-driven architecture"],
@@ -217,18 +416,31 @@ class TestProvideRecommendations:
         provide_recommendations(analysis)
 
         # Verify that console.print was called
-        assert mock_print.call_count > 0
+        assert console_print.calls
+
+    def test_provide_recommendations_single_render(self, console_print_passthrough):
+        """Test that all recommendations are rendered in one print call."""
+        analysis = {
+            "modules": [],
+            "config_files": [],
+            "structure": {},
+            "documentation": {"doc_suggestions": ["Add a CHANGELOG.md file"]},
+        }
+
+        with console.capture() as capture:
+            provide_recommendations(analysis)
+
+        assert len(console_print_passthrough.calls) == 1
+        output = capture.get()
+        assert "1. Add a CHANGELOG.md file" in output
+        assert "2. Consider adding FasCraft configuration" in output
 
 
 class TestAnalyzeProject:
     """Test the analyze_project function."""
 
-    def test_analyze_project_success(self, tmp_path):
+    def test_analyze_project_success(self, fastapi_project):
         """Test successful project analysis."""
-        # Create a valid FastAPI project
-        main_py = tmp_path / "main.py"
-        main_py.write_text("from fastapi import FastAPI\napp = FastAPI()")
-
         # Mock the analysis functions to avoid complex logic
         with patch(
             "fascraft.commands.analyze.analyze_project_structure"
@@ -246,13 +458,29 @@ class TestAnalyzeProject:
                         mock_analyze.return_value = {"project_name": "test"}
 
                         analyze_project(
-                            str(tmp_path), version_report=False, docs_only=False
+                            str(fastapi_project),
+                            version_report=False,
+                            docs_only=False,
                         )
 
                     mock_analyze.assert_called_once()
                     mock_display.assert_called_once()
                     mock_recommend.assert_called_once()
 
+    def test_analyze_project_accepts_path(self, fastapi_project):
+        """Test that a Path is passed through to the analysis unchanged."""
+        with (
+            patch(
+                "fascraft.commands.analyze.analyze_project_structure",
+                return_value={"project_name": "test"},
+            ) as mock_analyze,
+            patch("fascraft.commands.analyze.display_analysis_results"),
+            patch("fascraft.commands.analyze.provide_recommendations"),
+        ):
+            analyze_project(fastapi_project, version_report=False, docs_only=False)
+
+        assert mock_analyze.call_args.args[0] is fastapi_project
+
     def test_analyze_project_invalid_path(self):
         """Test analysis with invalid path."""
         with pytest.raises(typer.Exit) as exc_info:
@@ -298,6 +526,16 @@ pip install test
         assert score >= 40  # Should have title, sections, code blocks, and API info
         assert score <= 100
 
+    def test_analyze_readme_quality_scores_presence(self, tmp_path):
+        """Test that repeated README markers are only scored once."""
+        single = tmp_path / "single.md"
+        single.write_text("# Title\n## Usage\n```\nx\n```\n")
+        repeated = tmp_path / "repeated.md"
+        repeated.write_text("# Title\n" + "## Usage\n```\nx\n```\n" * 20)
+
+        assert analyze_readme_quality(single) == 40
+        assert analyze_readme_quality(repeated) == analyze_readme_quality(single)
+
     def test_analyze_changelog_quality(self, tmp_path):
         """Test changelog quality analysis."""
         changelog_file = tmp_path / "CHANGELOG.md"
@@ -322,6 +560,22 @@ pip install test
         score = analyze_changelog_quality(changelog_file)
         assert score == 100  # Should have all categories
 
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            ("### Security\n### Fixed\n### Changed\n### Added\n## [1.0.0]\n", 100),
+            ("## [1.0.0]\n### Fixed\n### Added\n", 60),
+            ("### Added\n### Added\n", 20),
+            ("# Changelog\n", 0),
+        ],
+    )
+    def test_analyze_changelog_quality_marker_order(self, tmp_path, content, expected):
+        """Test markers score by presence regardless of their order."""
+        changelog_file = tmp_path / "CHANGELOG.md"
+        changelog_file.write_text(content)
+
+        assert analyze_changelog_quality(changelog_file) == expected
+
     def test_extract_version_info(self, tmp_path):
         """Test version information extraction."""
         # Create pyproject.toml
@@ -345,6 +599,19 @@ Version: 1.2.3
         assert version_info["version_consistency"] is True
         assert version_info["latest_version"] == "1.2.3"
 
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            (b'[project]\r\nname = "demo"\r\nversion = "2.0.1"\r\n', "2.0.1"),
+            (b"[tool.poetry]\nversion='0.3.0'\n", "0.3.0"),
+            (b'[tool.poetry]\nname = "demo"\n', None),
+            (b'version = ""\nversion = "1.0.0"\n', None),
+        ],
+    )
+    def test_find_pyproject_version(self, content, expected):
+        """Test that the first version assignment in pyproject.toml is used."""
+        assert find_pyproject_version(content) == expected
+
     def test_analyze_documentation_quality_integration(self, tmp_path):
         """Test integration of documentation quality analysis."""
         # Create project structure
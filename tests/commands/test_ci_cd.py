@@ -1,10 +1,11 @@
 """Tests for the CI/CD command."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 import typer
 
+from fascraft.commands import ci_cd
 from fascraft.commands.ci_cd import (
     add_ci_cd,
     add_ci_cd_support,
@@ -17,66 +18,66 @@ from fascraft.commands.ci_cd import (
 class TestCICDCommand:
     """Test cases for CI/CD command functionality."""
 
-    def test_add_ci_cd_github_success(self, tmp_path):
+    def test_add_ci_cd_github_success(self, fastapi_project, stub_ci_cd_environment):
         """Test successful GitHub CI/CD support addition."""
-        # Create a mock FastAPI project
-        project_path = tmp_path / "test-project"
-        project_path.mkdir()
-        (project_path / "main.py").write_text("# FastAPI app")
-
-        with patch("fascraft.commands.ci_cd.Environment") as mock_env:
-            mock_template = MagicMock()
-            mock_template.render.return_value = "ci-cd content"
-            mock_env.return_value.get_template.return_value = mock_template
-
-            add_ci_cd_support(project_path, "github", force=False)
+        add_ci_cd_support(fastapi_project, "github", force=False)
 
-            # Verify CI/CD files were created
-            assert (project_path / ".github" / "workflows" / "ci.yml").exists()
-            assert (
-                project_path / ".github" / "workflows" / "dependency-update.yml"
-            ).exists()
-            assert (project_path / ".pre-commit-config.yaml").exists()
+        # Verify CI/CD files were created
+        assert (fastapi_project / ".github" / "workflows" / "ci.yml").exists()
+        assert (
+            fastapi_project / ".github" / "workflows" / "dependency-update.yml"
+        ).exists()
+        assert (fastapi_project / ".pre-commit-config.yaml").exists()
 
-    def test_add_ci_cd_gitlab_success(self, tmp_path):
+    def test_add_ci_cd_gitlab_success(self, fastapi_project, stub_ci_cd_environment):
         """Test successful GitLab CI/CD support addition."""
-        # Create a mock FastAPI project
-        project_path = tmp_path / "test-project"
-        project_path.mkdir()
-        (project_path / "main.py").write_text("# FastAPI app")
+        add_ci_cd_support(fastapi_project, "gitlab", force=False)
 
-        with patch("fascraft.commands.ci_cd.Environment") as mock_env:
-            mock_template = MagicMock()
-            mock_template.render.return_value = "ci-cd content"
-            mock_env.return_value.get_template.return_value = mock_template
+        # Verify CI/CD files were created
+        assert (fastapi_project / ".gitlab-ci.yml").exists()
+        assert (fastapi_project / ".pre-commit-config.yaml").exists()
 
-            add_ci_cd_support(project_path, "gitlab", force=False)
-
-            # Verify CI/CD files were created
-            assert (project_path / ".gitlab-ci.yml").exists()
-            assert (project_path / ".pre-commit-config.yaml").exists()
-
-    def test_add_ci_cd_both_success(self, tmp_path):
+    def test_add_ci_cd_both_success(self, fastapi_project, stub_ci_cd_environment):
         """Test successful both platforms CI/CD support addition."""
-        # Create a mock FastAPI project
+        add_ci_cd_support(fastapi_project, "both", force=False)
+
+        # Verify CI/CD files were created for both platforms
+        assert (fastapi_project / ".github" / "workflows" / "ci.yml").exists()
+        assert (
+            fastapi_project / ".github" / "workflows" / "dependency-update.yml"
+        ).exists()
+        assert (fastapi_project / ".gitlab-ci.yml").exists()
+        assert (fastapi_project / ".pre-commit-config.yaml").exists()
+
+    def test_add_ci_cd_reuses_shared_environment(self, tmp_path):
+        """Test repeated calls reuse the compiled templates of one environment."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        for project_path in (first, second):
+            project_path.mkdir()
+            (project_path / "main.py").write_text("# FastAPI app")
+
+        add_ci_cd_support(first, "both", force=False)
+        compiled = ci_cd._make_env().get_template(".gitlab-ci.yml.jinja2")
+        add_ci_cd_support(second, "both", force=False)
+
+        assert ci_cd._make_env().get_template(".gitlab-ci.yml.jinja2") is compiled
+        assert (second / ".gitlab-ci.yml").exists()
+
+    def test_make_env_builds_environment_once(self):
+        """Test the lazily built Jinja2 environment is shared across calls."""
+        assert ci_cd._make_env() is ci_cd._make_env()
+
+    def test_add_ci_cd_with_explicit_environment(self, tmp_path, stub_environment):
+        """Test a caller-supplied environment is used instead of the shared one."""
         project_path = tmp_path / "test-project"
         project_path.mkdir()
-        (project_path / "main.py").write_text("# FastAPI app")
 
-        with patch("fascraft.commands.ci_cd.Environment") as mock_env:
-            mock_template = MagicMock()
-            mock_template.render.return_value = "ci-cd content"
-            mock_env.return_value.get_template.return_value = mock_template
+        stub_environment.template.content = "custom content"
 
-            add_ci_cd_support(project_path, "both", force=False)
+        add_ci_cd_support(project_path, "gitlab", force=False, env=stub_environment)
 
-            # Verify CI/CD files were created for both platforms
-            assert (project_path / ".github" / "workflows" / "ci.yml").exists()
-            assert (
-                project_path / ".github" / "workflows" / "dependency-update.yml"
-            ).exists()
-            assert (project_path / ".gitlab-ci.yml").exists()
-            assert (project_path / ".pre-commit-config.yaml").exists()
+        assert (project_path / ".gitlab-ci.yml").read_text() == "custom content"
 
     def test_check_existing_ci_cd_files(self, tmp_path):
         """Test checking for existing CI/CD files."""
@@ -101,18 +102,15 @@ class TestCICDCommand:
         assert ".github/workflows/ci.yml" in existing_files
         assert ".gitlab-ci.yml" in existing_files
 
-    def test_render_ci_cd_template(self, tmp_path):
+    def test_render_ci_cd_template(self, tmp_path, stub_environment):
         """Test individual CI/CD template rendering."""
         project_path = tmp_path / "test-project"
         project_path.mkdir()
 
-        mock_env = MagicMock()
-        mock_template = MagicMock()
-        mock_template.render.return_value = "rendered content"
-        mock_env.get_template.return_value = mock_template
+        stub_environment.template.content = "rendered content"
 
         render_ci_cd_template(
-            mock_env,
+            stub_environment,
             project_path,
             "test-project",
             "ci.yml.jinja2",
@@ -120,8 +118,10 @@ class TestCICDCommand:
         )
 
         # Verify template was rendered
-        mock_env.get_template.assert_called_once_with("ci.yml.jinja2")
-        mock_template.render.assert_called_once_with(project_name="test-project")
+        assert stub_environment.requested == ["ci.yml.jinja2"]
+        assert stub_environment.template.render_calls == [
+            {"project_name": "test-project"}
+        ]
 
         # Verify file was written
         assert (project_path / ".github" / "workflows" / "ci.yml").exists()
@@ -146,6 +146,45 @@ class TestCICDCommand:
         assert "ENVIRONMENT=development" in dev_content
         assert "DEBUG=true" in dev_content
 
+    def test_setup_ci_cd_environments_keeps_existing_files(self, tmp_path):
+        """Test existing environment files are left untouched."""
+        project_path = tmp_path / "test-project"
+        project_path.mkdir()
+        (project_path / ".env.prod").write_text("CUSTOM=1")
+
+        setup_ci_cd_environments(project_path)
+
+        assert (project_path / ".env.prod").read_text() == "CUSTOM=1"
+        assert (project_path / ".env.dev").exists()
+
+    def test_render_ci_cd_template_skips_created_dirs(self, tmp_path, stub_environment):
+        """Test a parent directory is only created once per run."""
+        project_path = tmp_path / "test-project"
+        (project_path / ".github" / "workflows").mkdir(parents=True)
+
+        stub_environment.template.content = "content"
+        created_dirs = set()
+
+        with patch("pathlib.Path.mkdir") as mock_mkdir:
+            for output_name in (
+                ".github/workflows/ci.yml",
+                ".github/workflows/dependency-update.yml",
+            ):
+                render_ci_cd_template(
+                    stub_environment,
+                    project_path,
+                    "test-project",
+                    "template.jinja2",
+                    output_name,
+                    created_dirs,
+                )
+
+        assert mock_mkdir.call_count == 1
+        assert created_dirs == {project_path / ".github" / "workflows"}
+        assert (project_path / ".github" / "workflows" / "ci.yml").read_bytes() == (
+            b"content"
+        )
+
     def test_ci_cd_not_fastapi_project(self, tmp_path):
         """Test CI/CD fails for non-FastAPI projects."""
         project_path = tmp_path / "not-fastapi"
@@ -168,14 +207,10 @@ class TestCICDCommand:
         # Check that it's an exit exception with code 1
         assert exc_info.value.exit_code == 1
 
-    def test_ci_cd_invalid_platform(self, tmp_path):
+    def test_ci_cd_invalid_platform(self, fastapi_project):
         """Test CI/CD fails for invalid platform."""
-        project_path = tmp_path / "test-project"
-        project_path.mkdir()
-        (project_path / "main.py").write_text("# FastAPI app")
-
         with pytest.raises(typer.Exit) as exc_info:
-            add_ci_cd(project_path, platform="invalid", force=False)
+            add_ci_cd(fastapi_project, platform="invalid", force=False)
 
         # Check that it's an exit exception with code 1
         assert exc_info.value.exit_code == 1
@@ -1,9 +1,6 @@
 """Tests for the deploy command."""
 
-from unittest.mock import MagicMock, patch
-
 import pytest
-import typer
 
 from fascraft.commands.deploy import (
     check_existing_deployment_files,
@@ -13,96 +10,45 @@ from fascraft.commands.deploy import (
     setup_monitoring_config,
 )
 
+# Files generated per platform, plus the monitoring files every platform gets
+AWS_FILES = frozenset({"deploy/aws/ecs-deploy.sh"})
+KUBERNETES_FILES = frozenset({"deploy/kubernetes/deployment.yaml"})
+TERRAFORM_FILES = frozenset({"deploy/terraform/main.tf"})
+MONITORING_FILES = frozenset({"deploy/monitoring/prometheus.yml"})
+
 
 class TestDeployCommand:
     """Test cases for deploy command functionality."""
 
-    def test_generate_deployment_files_aws_success(self, tmp_path):
-        """Test successful AWS deployment files generation."""
-        # Create a mock FastAPI project
-        project_path = tmp_path / "test-project"
-        project_path.mkdir()
-        (project_path / "main.py").write_text("# FastAPI app")
-
-        with patch("fascraft.commands.deploy.Environment") as mock_env:
-            mock_template = MagicMock()
-            mock_template.render.return_value = "deployment content"
-            mock_env.return_value.get_template.return_value = mock_template
-
-            generate_deployment_files(project_path, "aws", force=False)
-
-            # Verify deployment files were created
-            assert (project_path / "deploy" / "aws" / "ecs-deploy.sh").exists()
-            assert (project_path / "deploy" / "monitoring" / "prometheus.yml").exists()
-
-    def test_generate_deployment_files_kubernetes_success(self, tmp_path):
-        """Test successful Kubernetes deployment files generation."""
-        # Create a mock FastAPI project
-        project_path = tmp_path / "test-project"
-        project_path.mkdir()
-        (project_path / "main.py").write_text("# FastAPI app")
-
-        with patch("fascraft.commands.deploy.Environment") as mock_env:
-            mock_template = MagicMock()
-            mock_template.render.return_value = "deployment content"
-            mock_env.return_value.get_template.return_value = mock_template
-
-            generate_deployment_files(project_path, "kubernetes", force=False)
-
-            # Verify deployment files were created
-            assert (project_path / "deploy" / "kubernetes" / "deployment.yaml").exists()
-            assert (project_path / "deploy" / "monitoring" / "prometheus.yml").exists()
-
-    def test_generate_deployment_files_terraform_success(self, tmp_path):
-        """Test successful Terraform deployment files generation."""
-        # Create a mock FastAPI project
-        project_path = tmp_path / "test-project"
-        project_path.mkdir()
-        (project_path / "main.py").write_text("# FastAPI app")
-
-        with patch("fascraft.commands.deploy.Environment") as mock_env:
-            mock_template = MagicMock()
-            mock_template.render.return_value = "deployment content"
-            mock_env.return_value.get_template.return_value = mock_template
-
-            generate_deployment_files(project_path, "terraform", force=False)
-
-            # Verify deployment files were created
-            assert (project_path / "deploy" / "terraform" / "main.tf").exists()
-            assert (project_path / "deploy" / "monitoring" / "prometheus.yml").exists()
-
-    def test_generate_deployment_files_all_success(self, tmp_path):
-        """Test successful all platforms deployment files generation."""
-        # Create a mock FastAPI project
-        project_path = tmp_path / "test-project"
-        project_path.mkdir()
-        (project_path / "main.py").write_text("# FastAPI app")
-
-        with patch("fascraft.commands.deploy.Environment") as mock_env:
-            mock_template = MagicMock()
-            mock_template.render.return_value = "deployment content"
-            mock_env.return_value.get_template.return_value = mock_template
-
-            generate_deployment_files(project_path, "all", force=False)
-
-            # Verify deployment files were created for all platforms
-            assert (project_path / "deploy" / "aws" / "ecs-deploy.sh").exists()
-            assert (project_path / "deploy" / "kubernetes" / "deployment.yaml").exists()
-            assert (project_path / "deploy" / "terraform" / "main.tf").exists()
-            assert (project_path / "deploy" / "monitoring" / "prometheus.yml").exists()
-
-    def test_check_existing_deployment_files(self, tmp_path):
+    @pytest.mark.parametrize(
+        "platform, expected",
+        [
+            ("aws", AWS_FILES | MONITORING_FILES),
+            ("kubernetes", KUBERNETES_FILES | MONITORING_FILES),
+            ("terraform", TERRAFORM_FILES | MONITORING_FILES),
+            (
+                "all",
+                AWS_FILES | KUBERNETES_FILES | TERRAFORM_FILES | MONITORING_FILES,
+            ),
+        ],
+    )
+    def test_generate_deployment_files_success(
+        self,
+        fastapi_project,
+        stub_deploy_environment,
+        project_files,
+        platform,
+        expected,
+    ):
+        """Test successful deployment files generation for each platform."""
+        generate_deployment_files(fastapi_project, platform, force=False)
+
+        # Verify platform and monitoring files were created
+        assert expected.issubset(project_files(fastapi_project))
+
+    def test_check_existing_deployment_files(self, existing_files_project):
         """Test checking for existing deployment files."""
-        project_path = tmp_path / "test-project"
-        project_path.mkdir()
-
-        # Create some existing deployment files
-        (project_path / "deploy" / "aws").mkdir(parents=True)
-        (project_path / "deploy" / "aws" / "ecs-deploy.sh").write_text("# existing")
-        (project_path / "deploy" / "kubernetes").mkdir(parents=True)
-        (project_path / "deploy" / "kubernetes" / "deployment.yaml").write_text(
-            "# existing"
-        )
+        project_path = existing_files_project
 
         # Check AWS platform
         existing_files = check_existing_deployment_files(project_path, "aws")
@@ -117,18 +63,15 @@ class TestDeployCommand:
         assert "deploy/aws/ecs-deploy.sh" in existing_files
         assert "deploy/kubernetes/deployment.yaml" in existing_files
 
-    def test_render_deployment_template(self, tmp_path):
+    def test_render_deployment_template(self, tmp_path, stub_environment):
         """Test individual deployment template rendering."""
         project_path = tmp_path / "test-project"
         project_path.mkdir()
 
-        mock_env = MagicMock()
-        mock_template = MagicMock()
-        mock_template.render.return_value = "rendered content"
-        mock_env.get_template.return_value = mock_template
+        stub_environment.template.content = "rendered content"
 
         render_deployment_template(
-            mock_env,
+            stub_environment,
             project_path,
             "test-project",
             "deployment.yaml.jinja2",
@@ -136,11 +79,12 @@ class TestDeployCommand:
         )
 
         # Verify template was rendered
-        mock_env.get_template.assert_called_once_with("deployment.yaml.jinja2")
-        mock_template.render.assert_called_once_with(project_name="test-project")
+        assert stub_environment.requested == ["deployment.yaml.jinja2"]
+        assert stub_environment.template.render_calls == [
+            {"project_name": "test-project"}
+        ]
 
         # Verify file was written
-        assert (project_path / "deploy" / "kubernetes" / "deployment.yaml").exists()
         assert (
             project_path / "deploy" / "kubernetes" / "deployment.yaml"
         ).read_text() == "rendered content"
@@ -152,47 +96,25 @@ class TestDeployCommand:
 
         setup_monitoring_config(project_path)
 
-        # Verify monitoring files were created
-        assert (project_path / "deploy" / "monitoring" / "monitoring.yml").exists()
+        # Verify monitoring files were created with their content
         assert (project_path / "config" / "logging.yml").exists()
-
-        # Verify content
         monitoring_content = (
             project_path / "deploy" / "monitoring" / "monitoring.yml"
         ).read_text()
         assert "monitoring:" in monitoring_content
         assert "prometheus:" in monitoring_content
 
-    def test_deploy_not_fastapi_project(self, tmp_path):
-        """Test deploy fails for non-FastAPI projects."""
-        project_path = tmp_path / "not-fastapi"
-        project_path.mkdir()
-        # No main.py file
-
-        with pytest.raises(typer.Exit) as exc_info:
-            generate(project_path, platform="aws", force=False)
-
-        # Check that it's an exit exception with code 1
-        assert exc_info.value.exit_code == 1
-
-    def test_deploy_project_not_exists(self, tmp_path):
-        """Test deploy fails for non-existent projects."""
-        project_path = tmp_path / "non-existent"
-
-        with pytest.raises(typer.Exit) as exc_info:
-            generate(project_path, platform="aws", force=False)
-
-        # Check that it's an exit exception with code 1
-        assert exc_info.value.exit_code == 1
-
-    def test_deploy_invalid_platform(self, tmp_path):
-        """Test deploy fails for invalid platform."""
-        project_path = tmp_path / "test-project"
-        project_path.mkdir()
-        (project_path / "main.py").write_text("# FastAPI app")
-
-        with pytest.raises(typer.Exit) as exc_info:
-            generate(project_path, platform="invalid", force=False)
-
-        # Check that it's an exit exception with code 1
-        assert exc_info.value.exit_code == 1
+    @pytest.mark.parametrize(
+        "project_fixture, platform",
+        [
+            ("empty_project", "aws"),
+            ("nonexistent_project", "aws"),
+            ("fastapi_project", "invalid"),
+        ],
+        ids=["not-fastapi-project", "project-not-exists", "invalid-platform"],
+    )
+    def test_deploy_failures(self, request, assert_exits, project_fixture, platform):
+        """Test deploy exits with code 1 for unusable projects and platforms."""
+        project_path = request.getfixturevalue(project_fixture)
+
+        assert_exits(1, generate, project_path, platform=platform, force=False)
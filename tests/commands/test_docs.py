@@ -1,11 +1,11 @@
 """Tests for the documentation generation command."""
 
 import json
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
+import click
 import pytest
 import typer
-from typer.testing import CliRunner
 
 from fascraft.commands.docs import (
     docs_app,
@@ -242,37 +242,39 @@ def generate_documentation_helper(
 class TestFastAPIProjectDetection:
     """Test FastAPI project detection functionality."""
 
-    def test_is_fastapi_project_with_main_py(self, tmp_path):
-        """Test detection when main.py contains FastAPI."""
-        main_file = tmp_path / "main.py"
-        main_file.write_text("from fastapi import FastAPI\napp = FastAPI()")
-
-        assert is_fastapi_project(tmp_path) is True
-
-    def test_is_fastapi_project_with_pyproject_toml(self, tmp_path):
-        """Test detection when pyproject.toml contains FastAPI dependency."""
-        pyproject_file = tmp_path / "pyproject.toml"
-        pyproject_file.write_text(
-            "[tool.poetry.dependencies]\npython = '^3.8'\nfastapi = '^0.68.0'"
-        )
-
-        assert is_fastapi_project(tmp_path) is True
-
-    def test_is_fastapi_project_without_indicators(self, tmp_path):
-        """Test detection when no FastAPI indicators are present."""
-        assert is_fastapi_project(tmp_path) is False
-
-    def test_is_fastapi_project_case_insensitive(self, tmp_path):
-        """Test detection is case insensitive."""
-        main_file = tmp_path / "main.py"
-        main_file.write_text("from FastAPI import FastAPI\napp = FastAPI()")
+    @pytest.mark.parametrize(
+        "filename, content, expected",
+        [
+            ("main.py", "from fastapi import FastAPI\napp = FastAPI()", True),
+            (
+                "pyproject.toml",
+                "[tool.poetry.dependencies]\npython = '^3.8'\nfastapi = '^0.68.0'",
+                True,
+            ),
+            (None, None, False),
+            ("main.py", "from FastAPI import FastAPI\napp = FastAPI()", True),
+        ],
+        ids=["main-py", "pyproject-toml", "no-indicators", "case-insensitive"],
+    )
+    def test_is_fastapi_project(self, tmp_path, filename, content, expected):
+        """Test detection from main.py or pyproject.toml, ignoring case."""
+        if filename is not None:
+            (tmp_path / filename).write_text(content)
 
-        assert is_fastapi_project(tmp_path) is True
+        assert is_fastapi_project(tmp_path) is expected
 
 
 class TestProjectInfoExtraction:
     """Test project information extraction functionality."""
 
+    @pytest.fixture(autouse=True)
+    def _mocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Replace the shared dependency graph with an empty mock."""
+        self.mock_dependency_graph = MagicMock(modules={})
+        monkeypatch.setattr(
+            "fascraft.commands.docs.dependency_graph", self.mock_dependency_graph
+        )
+
     def test_get_project_info_basic(self, tmp_path):
         """Test basic project info extraction."""
         project_info = get_project_info(tmp_path)
@@ -300,10 +302,9 @@ class TestProjectInfoExtraction:
 
         assert project_info["version"] == "1.2.3"
 
-    @patch("fascraft.commands.docs.dependency_graph")
-    def test_get_project_info_with_modules(self, mock_dependency_graph, tmp_path):
+    def test_get_project_info_with_modules(self, tmp_path):
         """Test project info extraction with modules."""
-        mock_dependency_graph.modules = {"users": {}, "products": {}}
+        self.mock_dependency_graph.modules = {"users": {}, "products": {}}
 
         project_info = get_project_info(tmp_path)
 
@@ -314,15 +315,22 @@ class TestProjectInfoExtraction:
 class TestModuleInfoExtraction:
     """Test module information extraction functionality."""
 
+    @pytest.fixture(autouse=True)
+    def _mocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Replace the shared dependency graph with an empty mock."""
+        self.mock_dependency_graph = MagicMock(modules={})
+        monkeypatch.setattr(
+            "fascraft.commands.docs.dependency_graph", self.mock_dependency_graph
+        )
+
     def test_get_module_info_basic(self, tmp_path):
         """Test basic module info extraction."""
         module_path = tmp_path / "test_module"
         module_path.mkdir()
 
-        # Create some Python files
-        (module_path / "__init__.py").write_text("")
-        (module_path / "models.py").write_text("")
-        (module_path / "services.py").write_text("")
+        # Create some empty Python files
+        for name in ("__init__.py", "models.py", "services.py"):
+            (module_path / name).touch()
 
         module_info = get_module_info(tmp_path, "test_module")
 
@@ -336,13 +344,12 @@ class TestModuleInfoExtraction:
         with pytest.raises(ModuleNotFoundError):  # Use the correct exception type
             get_module_info(tmp_path, "nonexistent_module")
 
-    @patch("fascraft.commands.docs.dependency_graph")
-    def test_get_module_info_with_dependencies(self, mock_dependency_graph, tmp_path):
+    def test_get_module_info_with_dependencies(self, tmp_path):
         """Test module info extraction with dependencies."""
         module_path = tmp_path / "test_module"
         module_path.mkdir()
 
-        mock_dependency_graph.modules = {
+        self.mock_dependency_graph.modules = {
             "test_module": {"dependencies": ["users", "products"]}
         }
 
@@ -355,25 +362,32 @@ class TestModuleInfoExtraction:
 class TestDocumentationGeneration:
     """Test documentation generation functionality."""
 
-    def test_generate_api_documentation_project(self, tmp_path):
-        """Test API documentation generation for project."""
-        docs = generate_api_documentation(tmp_path)
-
-        assert "API Documentation for" in docs
-        assert tmp_path.name in docs
-
-    def test_generate_api_documentation_module(self, tmp_path):
-        """Test API documentation generation for module."""
-        docs = generate_api_documentation(tmp_path, "test_module")
-
-        assert "API Documentation for Test_Module Module" in docs
-
-    def test_generate_readme_template_project(self, tmp_path):
-        """Test README template generation for project."""
-        readme = generate_readme_template(tmp_path)
-
-        assert "# " in readme
-        assert tmp_path.name in readme
+    @pytest.mark.parametrize(
+        "generate, heading",
+        [
+            (generate_api_documentation, "API Documentation for"),
+            (generate_readme_template, "# "),
+            (generate_changelog_template, "Changelog for"),
+        ],
+        ids=["api", "readme", "changelog"],
+    )
+    def test_generate_template_project(
+        self, tmp_path, assert_contains, generate, heading
+    ):
+        """Test project templates carry their heading and the project name."""
+        assert_contains(generate(tmp_path), heading, tmp_path.name)
+
+    @pytest.mark.parametrize(
+        "generate, heading",
+        [
+            (generate_api_documentation, "API Documentation for Test_Module Module"),
+            (generate_changelog_template, "Changelog for Test_Module Module"),
+        ],
+        ids=["api", "changelog"],
+    )
+    def test_generate_template_module(self, tmp_path, generate, heading):
+        """Test module templates are headed with the module name."""
+        assert heading in generate(tmp_path, "test_module")
 
     def test_generate_readme_template_module(self, tmp_path):
         """Test README template generation for module."""
@@ -387,190 +401,188 @@ class TestDocumentationGeneration:
 
         assert "# Test_Module Module" in readme
 
-    def test_generate_changelog_template_project(self, tmp_path):
-        """Test changelog template generation for project."""
-        changelog = generate_changelog_template(tmp_path)
-
-        assert "Changelog for" in changelog
-        assert tmp_path.name in changelog
-
-    def test_generate_changelog_template_module(self, tmp_path):
-        """Test changelog template generation for module."""
-        changelog = generate_changelog_template(tmp_path, "test_module")
-
-        assert "Changelog for Test_Module Module" in changelog
-
 
 class TestDocumentationCommand:
     """Test the main documentation generation command."""
 
-    @patch("fascraft.commands.docs.is_fastapi_project")
-    @patch("fascraft.commands.docs.get_project_info")
-    def test_generate_documentation_success(
-        self, mock_get_project_info, mock_is_fastapi, tmp_path
-    ):
+    @pytest.fixture(autouse=True)
+    def _mocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Replace the docs helpers these tests stub out with mocks."""
+        self.mock_is_fastapi = MagicMock(return_value=True)
+        monkeypatch.setattr(
+            "fascraft.commands.docs.is_fastapi_project", self.mock_is_fastapi
+        )
+        self.mock_get_project_info = MagicMock()
+        monkeypatch.setattr(
+            "fascraft.commands.docs.get_project_info", self.mock_get_project_info
+        )
+        self.mock_get_module_info = MagicMock()
+        monkeypatch.setattr(
+            "fascraft.commands.docs.get_module_info", self.mock_get_module_info
+        )
+
+    def test_generate_documentation_success(self, fastapi_project, project_files):
         """Test successful documentation generation."""
-        mock_is_fastapi.return_value = True
-        mock_get_project_info.return_value = {
+        self.mock_get_project_info.return_value = {
             "name": "test_project",
             "version": "1.0.0",
             "description": "Test project",
         }
 
-        # Create a mock main.py to satisfy FastAPI detection
-        (tmp_path / "main.py").write_text("from fastapi import FastAPI")
-
         generate_documentation_helper(
-            path=str(tmp_path),
+            path=str(fastapi_project),
             output_dir="docs",
             include_api=True,
             include_readme=True,
             include_changelog=True,
         )
 
-        # Check that docs directory was created
-        docs_dir = tmp_path / "docs"
-        assert docs_dir.exists()
-
-        # Check that files were generated
-        assert (docs_dir / "api_documentation.md").exists()
-        assert (docs_dir / "README_template.md").exists()
-        assert (docs_dir / "CHANGELOG_template.md").exists()
-        assert (docs_dir / "project_overview.md").exists()
+        # Check that the docs directory holds the generated files
+        missing = {
+            "api_documentation.md",
+            "README_template.md",
+            "CHANGELOG_template.md",
+            "project_overview.md",
+        } - project_files(fastapi_project / "docs")
+        assert not missing, f"Expected files were not generated: {sorted(missing)}"
 
-    @patch("fascraft.commands.docs.is_fastapi_project")
-    def test_generate_documentation_not_fastapi_project(
-        self, mock_is_fastapi, tmp_path
-    ):
+    def test_generate_documentation_not_fastapi_project(self, tmp_path):
         """Test documentation generation with non-FastAPI project."""
-        mock_is_fastapi.return_value = False
+        self.mock_is_fastapi.return_value = False
 
         with pytest.raises(typer.Exit):
             generate_documentation(path=str(tmp_path))
 
-    @patch("fascraft.commands.docs.is_fastapi_project")
-    def test_generate_documentation_path_not_exists(self, mock_is_fastapi):
+    def test_generate_documentation_path_not_exists(self):
         """Test documentation generation with non-existent path."""
-        mock_is_fastapi.return_value = True
-
         with pytest.raises(typer.Exit):
             generate_documentation(path="/nonexistent/path")
 
-    @patch("fascraft.commands.docs.is_fastapi_project")
-    @patch("fascraft.commands.docs.get_project_info")
-    @patch("fascraft.commands.docs.get_module_info")
-    def test_generate_documentation_with_module(
-        self, mock_get_module_info, mock_get_project_info, mock_is_fastapi, tmp_path
-    ):
+    def test_generate_documentation_with_module(self, fastapi_project):
         """Test documentation generation for specific module."""
-        mock_is_fastapi.return_value = True
-        mock_get_project_info.return_value = {
+        self.mock_get_project_info.return_value = {
             "name": "test_project",
             "version": "1.0.0",
             "description": "Test project",
         }
-        mock_get_module_info.return_value = {
+        self.mock_get_module_info.return_value = {
             "name": "test_module",
-            "path": str(tmp_path / "test_module"),
+            "path": str(fastapi_project / "test_module"),
             "files": ["models.py", "services.py"],
             "dependencies": ["users"],
         }
 
-        # Create a mock main.py to satisfy FastAPI detection
-        (tmp_path / "main.py").write_text("from fastapi import FastAPI")
-
         generate_documentation_helper(
-            path=str(tmp_path), module="test_module", output_dir="docs"
+            path=str(fastapi_project), module="test_module", output_dir="docs"
         )
 
         # Check that module-specific documentation was generated
-        docs_dir = tmp_path / "docs"
+        docs_dir = fastapi_project / "docs"
         assert (docs_dir / "test_module_overview.md").exists()
 
 
 class TestOpenAPIGeneration:
     """Test OpenAPI specification generation."""
 
-    @patch("fascraft.commands.docs.is_fastapi_project")
-    def test_generate_openapi_spec_success(self, mock_is_fastapi, tmp_path):
+    @pytest.fixture(autouse=True)
+    def _mocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Replace the docs helpers these tests stub out with mocks."""
+        self.mock_is_fastapi = MagicMock(return_value=True)
+        monkeypatch.setattr(
+            "fascraft.commands.docs.is_fastapi_project", self.mock_is_fastapi
+        )
+
+    def test_generate_openapi_spec_success(self, monkeypatch, tmp_path):
         """Test successful OpenAPI specification generation."""
-        mock_is_fastapi.return_value = True
+        # FastAPI detection is mocked, so main.py only needs to exist
+        (tmp_path / "main.py").touch()
 
-        # Create a mock main.py
-        (tmp_path / "main.py").write_text("from fastapi import FastAPI")
+        # Capture the spec as it is serialized instead of reading it back
+        dumped: list[dict] = []
+        real_dumps = json.dumps
+
+        def record_dumps(obj, **kwargs):
+            dumped.append(obj)
+            return real_dumps(obj, **kwargs)
+
+        monkeypatch.setattr(json, "dumps", record_dumps)
 
         generate_openapi_spec(
             path=str(tmp_path), output_file="openapi.json", format="json"
         )
 
         # Check that OpenAPI spec was generated
-        openapi_file = tmp_path / "openapi.json"
-        assert openapi_file.exists()
+        assert (tmp_path / "openapi.json").exists()
 
         # Check content
-        content = json.loads(openapi_file.read_text())
+        [content] = dumped
         assert content["openapi"] == "3.0.0"
         assert content["info"]["title"] == tmp_path.name
 
-    @patch("fascraft.commands.docs.is_fastapi_project")
-    def test_generate_openapi_spec_not_fastapi_project(self, mock_is_fastapi, tmp_path):
+    def test_generate_openapi_spec_not_fastapi_project(self, tmp_path):
         """Test OpenAPI generation with non-FastAPI project."""
-        mock_is_fastapi.return_value = False
+        self.mock_is_fastapi.return_value = False
 
         with pytest.raises(typer.Exit):
             generate_openapi_spec(path=str(tmp_path))
 
-    @patch("fascraft.commands.docs.is_fastapi_project")
-    def test_generate_openapi_spec_no_main_py(self, mock_is_fastapi, tmp_path):
+    def test_generate_openapi_spec_no_main_py(self, tmp_path):
         """Test OpenAPI generation without main.py."""
-        mock_is_fastapi.return_value = True
-
         with pytest.raises(typer.Exit):
             generate_openapi_spec(path=str(tmp_path))
 
 
-class TestCLIInterface:
-    """Test the CLI interface for documentation commands."""
+@pytest.fixture(scope="module")
+def docs_command() -> click.Group:
+    """Build the Click group behind the docs Typer app once."""
+    return typer.main.get_command(docs_app)
 
-    def test_docs_app_help(self):
-        """Test that docs app provides help."""
-        runner = CliRunner()
-        result = runner.invoke(docs_app, ["--help"])
 
-        assert result.exit_code == 0
-        assert "Documentation generation commands" in result.output
-
-    def test_generate_command_help(self):
-        """Test that generate command provides help."""
-        runner = CliRunner()
-        result = runner.invoke(docs_app, ["generate", "--help"])
+class TestCLIInterface:
+    """Test the CLI interface for documentation commands."""
 
-        assert result.exit_code == 0
-        assert "Generate comprehensive documentation" in result.output
+    @pytest.mark.parametrize(
+        "command_name, expected",
+        [
+            (None, "Documentation generation commands"),
+            ("generate", "Generate comprehensive documentation"),
+            ("openapi", "Generate OpenAPI specification"),
+        ],
+        ids=["docs-app", "generate-command", "openapi-command"],
+    )
+    def test_command_help(self, docs_command, capsys, command_name, expected):
+        """Test that the docs app and its commands provide help."""
+        command = docs_command
+        if command_name is not None:
+            command = docs_command.commands[command_name]
 
-    def test_openapi_command_help(self):
-        """Test that openapi command provides help."""
-        runner = CliRunner()
-        result = runner.invoke(docs_app, ["openapi", "--help"])
+        # Typer renders help with Rich, which prints it rather than returning it
+        command.get_help(click.Context(command, info_name=command_name or "docs"))
 
-        assert result.exit_code == 0
-        assert "Generate OpenAPI specification" in result.output
+        assert expected in capsys.readouterr().out
 
 
 class TestErrorHandling:
     """Test error handling in documentation generation."""
 
-    @patch("fascraft.commands.docs.is_fastapi_project")
-    @patch("fascraft.commands.docs.get_project_info")
-    def test_generate_documentation_with_warnings(
-        self, mock_get_project_info, mock_is_fastapi, tmp_path
-    ):
+    @pytest.fixture(autouse=True)
+    def _mocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Replace the docs helpers these tests stub out with mocks."""
+        self.mock_is_fastapi = MagicMock(return_value=True)
+        monkeypatch.setattr(
+            "fascraft.commands.docs.is_fastapi_project", self.mock_is_fastapi
+        )
+        self.mock_get_project_info = MagicMock()
+        monkeypatch.setattr(
+            "fascraft.commands.docs.get_project_info", self.mock_get_project_info
+        )
+
+    def test_generate_documentation_with_warnings(self, tmp_path):
         """Test documentation generation with warnings."""
-        mock_is_fastapi.return_value = True
-        mock_get_project_info.side_effect = Exception("Project info error")
+        self.mock_get_project_info.side_effect = Exception("Project info error")
 
-        # Create a mock main.py to satisfy FastAPI detection
-        (tmp_path / "main.py").write_text("from fastapi import FastAPI")
+        # FastAPI detection is mocked, so main.py only needs to exist
+        (tmp_path / "main.py").touch()
 
         # Should not raise exception, just show warnings
         generate_documentation(path=str(tmp_path), output_dir="docs")
@@ -579,23 +591,20 @@ class TestErrorHandling:
         docs_dir = tmp_path / "docs"
         assert docs_dir.exists()
 
-    @patch("fascraft.commands.docs.is_fastapi_project")
-    @patch("fascraft.commands.docs.get_project_info")
-    @patch("fascraft.commands.docs.generate_api_documentation")
-    def test_generate_documentation_api_docs_failure(
-        self, mock_generate_api, mock_get_project_info, mock_is_fastapi, tmp_path
-    ):
+    def test_generate_documentation_api_docs_failure(self, monkeypatch, tmp_path):
         """Test documentation generation when API docs generation fails."""
-        mock_is_fastapi.return_value = True
-        mock_get_project_info.return_value = {
+        self.mock_get_project_info.return_value = {
             "name": "test_project",
             "version": "1.0.0",
             "description": "Test project",
         }
-        mock_generate_api.side_effect = Exception("API docs error")
+        monkeypatch.setattr(
+            "fascraft.commands.docs.generate_api_documentation",
+            MagicMock(side_effect=Exception("API docs error")),
+        )
 
-        # Create a mock main.py to satisfy FastAPI detection
-        (tmp_path / "main.py").write_text("from fastapi import FastAPI")
+        # FastAPI detection is mocked, so main.py only needs to exist
+        (tmp_path / "main.py").touch()
 
         # Should not raise exception, just show warnings
         generate_documentation(path=str(tmp_path), output_dir="docs", include_api=True)
@@ -608,65 +617,78 @@ class TestErrorHandling:
 class TestTemplateRendering:
     """Test template rendering functionality."""
 
-    def test_template_variables_substitution(self, tmp_path):
+    @pytest.fixture(autouse=True)
+    def _mocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Replace the docs helpers these tests stub out with mocks."""
+        self.mock_get_project_info = MagicMock()
+        monkeypatch.setattr(
+            "fascraft.commands.docs.get_project_info", self.mock_get_project_info
+        )
+
+    def test_template_variables_substitution(self, fastapi_project, assert_contains):
         """Test that template variables are properly substituted."""
-        # Create a mock main.py to satisfy FastAPI detection
-        (tmp_path / "main.py").write_text("from fastapi import FastAPI")
-
-        # Mock project info
-        with patch("fascraft.commands.docs.get_project_info") as mock_get_project_info:
-            mock_get_project_info.return_value = {
-                "name": "test_project",
-                "version": "2.0.0",
-                "description": "A test project",
-                "modules": ["users", "products"],
-            }
-
-            generate_documentation_helper(
-                path=str(tmp_path), output_dir="docs", include_readme=True
-            )
+        self.mock_get_project_info.return_value = {
+            "name": "test_project",
+            "version": "2.0.0",
+            "description": "A test project",
+            "modules": ["users", "products"],
+        }
 
-            # Check that variables were substituted
-            readme_file = tmp_path / "docs" / "README_template.md"
-            content = readme_file.read_text()
+        generate_documentation_helper(
+            path=str(fastapi_project), output_dir="docs", include_readme=True
+        )
 
-            assert "test_project" in content
-            assert "2.0.0" in content
-            assert "A test project" in content
-            assert "users" in content
-            assert "products" in content
+        # Check that variables were substituted
+        readme_file = fastapi_project / "docs" / "README_template.md"
+        assert_contains(
+            readme_file.read_bytes(),
+            b"test_project",
+            b"2.0.0",
+            b"A test project",
+            b"users",
+            b"products",
+        )
 
 
 class TestIntegration:
     """Integration tests for documentation generation."""
 
-    @patch("fascraft.commands.docs.is_fastapi_project")
-    @patch("fascraft.commands.docs.get_project_info")
-    @patch("fascraft.commands.docs.get_module_info")
+    @pytest.fixture(autouse=True)
+    def _mocks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Replace the docs helpers these tests stub out with mocks."""
+        self.mock_is_fastapi = MagicMock(return_value=True)
+        monkeypatch.setattr(
+            "fascraft.commands.docs.is_fastapi_project", self.mock_is_fastapi
+        )
+        self.mock_get_project_info = MagicMock()
+        monkeypatch.setattr(
+            "fascraft.commands.docs.get_project_info", self.mock_get_project_info
+        )
+        self.mock_get_module_info = MagicMock()
+        monkeypatch.setattr(
+            "fascraft.commands.docs.get_module_info", self.mock_get_module_info
+        )
+
     def test_full_documentation_generation_workflow(
-        self, mock_get_module_info, mock_get_project_info, mock_is_fastapi, tmp_path
+        self, fastapi_project, project_files, assert_contains
     ):
         """Test the complete documentation generation workflow."""
-        mock_is_fastapi.return_value = True
-        mock_get_project_info.return_value = {
+        self.mock_get_project_info.return_value = {
             "name": "test_project",
             "version": "1.0.0",
             "description": "Test project",
             "modules": ["users", "products"],
         }
-        mock_get_module_info.return_value = {
+        self.mock_get_module_info.return_value = {
             "name": "users",
-            "path": str(tmp_path / "users"),
+            "path": str(fastapi_project / "users"),
             "files": ["models.py", "services.py"],
             "dependencies": [],
         }
 
-        # Create a mock main.py to satisfy FastAPI detection
-        (tmp_path / "main.py").write_text("from fastapi import FastAPI")
-
         # Generate documentation for a specific module
         generate_documentation_helper(
-            path=str(tmp_path),
+            path=str(fastapi_project),
             module="users",
             output_dir="docs",
             include_api=True,
@@ -675,22 +697,20 @@ class TestIntegration:
         )
 
         # Verify all expected files were generated
-        docs_dir = tmp_path / "docs"
-        expected_files = [
+        docs_dir = fastapi_project / "docs"
+        missing = {
             "api_documentation.md",
             "README_template.md",
             "CHANGELOG_template.md",
             "users_overview.md",
-        ]
-
-        for expected_file in expected_files:
-            assert (
-                docs_dir / expected_file
-            ).exists(), f"Expected file {expected_file} was not generated"
+        } - project_files(docs_dir)
+        assert not missing, f"Expected files were not generated: {sorted(missing)}"
 
         # Verify file contents
         users_overview = docs_dir / "users_overview.md"
-        content = users_overview.read_text()
-        assert "Users Module Overview" in content
-        assert "models.py" in content
-        assert "services.py" in content
+        assert_contains(
+            users_overview.read_bytes(),
+            b"Users Module Overview",
+            b"models.py",
+            b"services.py",
+        )
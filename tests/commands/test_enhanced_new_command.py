@@ -1,14 +1,20 @@
 """Tests for enhanced error handling in the new.py command."""
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from jinja2 import TemplateNotFound, TemplateSyntaxError
 
 from fascraft.commands.new import (
+    ALL_TEMPLATES,
     create_backup_directory,
     create_minimal_structure,
     create_project_with_graceful_degradation,
     create_project_with_rollback,
+    get_bytecode_cache,
+    get_template_sources,
+    open_output_file,
     render_essential_templates,
     render_project_templates_with_progress,
     render_single_template,
@@ -57,6 +63,57 @@ class TestCreateProjectWithRollback:
         mock_render.assert_called_once_with(project_path, project_name)
         mock_validate_gen.assert_called_once_with(project_path)
 
+    @pytest.mark.parametrize("has_content", [False, True])
+    @patch("fascraft.commands.new.validate_file_system_writable")
+    @patch("fascraft.commands.new.validate_disk_space")
+    @patch("fascraft.commands.new.create_project_structure")
+    @patch("fascraft.commands.new.render_project_templates_with_progress")
+    @patch("fascraft.commands.new.validate_generated_project")
+    @patch("fascraft.commands.new.create_backup_directory")
+    def test_create_project_with_rollback_backs_up_only_non_empty_directory(
+        self,
+        mock_backup,
+        mock_validate_gen,
+        mock_render,
+        mock_create_structure,
+        mock_validate_disk,
+        mock_validate_fs,
+        has_content,
+        tmp_path,
+    ):
+        """Test that an existing directory is backed up only if it has content."""
+        project_path = tmp_path / "test_project"
+        project_path.mkdir()
+        if has_content:
+            (project_path / "notes.txt").write_text("keep me")
+
+        create_project_with_rollback(project_path, "test_project")
+
+        assert mock_backup.called is has_content
+
+    def test_create_project_with_rollback_keeps_existing_files(self, tmp_path):
+        """Test files the templates don't generate stay in the project."""
+        project_path = tmp_path / "test_project"
+        (project_path / ".git").mkdir(parents=True)
+        (project_path / ".git" / "HEAD").write_text("ref: refs/heads/main")
+        (project_path / "config").mkdir()
+        (project_path / "config" / "local.py").write_text("DEBUG = True")
+        (project_path / "data.csv").write_text("id,name")
+        (project_path / "main.py").write_text("# old main")
+
+        create_project_with_rollback(project_path, "test_project")
+
+        assert (project_path / ".git" / "HEAD").read_text() == "ref: refs/heads/main"
+        assert (project_path / "config" / "local.py").read_text() == "DEBUG = True"
+        assert (project_path / "data.csv").read_text() == "id,name"
+        assert (project_path / "config" / "settings.py").exists()
+        assert (project_path / "main.py").read_text() != "# old main"
+
+        # Only the overwritten file is left in the backup
+        (backup_path,) = tmp_path.glob("test_project_backup_*")
+        assert (backup_path / "main.py").read_text() == "# old main"
+        assert not (backup_path / "data.csv").exists()
+
     @patch("fascraft.commands.new.validate_file_system_writable")
     @patch("fascraft.commands.new.validate_disk_space")
     @patch("fascraft.commands.new.create_project_structure")
@@ -129,9 +186,29 @@ class TestCreateBackupDirectory:
 
         result = create_backup_directory(source_path)
 
-        # Verify backup was created
+        # Verify the project was moved aside without copying
         assert result is not None
         assert "backup_20231201_143022" in str(result)
+        assert (result / "file.txt").read_text() == "test content"
+        assert not source_path.exists()
+        mock_copytree.assert_not_called()
+
+    @patch("shutil.copytree")
+    @patch("fascraft.commands.new.datetime")
+    def test_create_backup_directory_copy_fallback(
+        self, mock_datetime, mock_copytree, tmp_path
+    ):
+        """Test that backup falls back to copying when rename fails."""
+        # Mock datetime
+        mock_datetime.now.return_value.strftime.return_value = "20231201_143022"
+
+        source_path = tmp_path / "existing_project"
+        source_path.mkdir()
+
+        with patch.object(Path, "rename", side_effect=OSError("Cross-device link")):
+            result = create_backup_directory(source_path)
+
+        assert result is not None
         mock_copytree.assert_called_once()
 
     @patch("shutil.copytree")
@@ -149,7 +226,8 @@ class TestCreateBackupDirectory:
         source_path = tmp_path / "existing_project"
         source_path.mkdir()
 
-        result = create_backup_directory(source_path)
+        with patch.object(Path, "rename", side_effect=OSError("Cross-device link")):
+            result = create_backup_directory(source_path)
 
         # Verify backup creation failed gracefully
         assert result is None
@@ -348,7 +426,7 @@ class TestRenderEssentialTemplates:
             project_path, project_name, "fascraft.toml.jinja2", "fascraft.toml"
         )
         mock_render_single.assert_any_call(
-            project_path, project_name, "env.jinja2", ".env.sample"
+            project_path, project_name, "env.sample.jinja2", ".env.sample"
         )
         mock_render_single.assert_any_call(
             project_path, project_name, ".gitignore.jinja2", ".gitignore"
@@ -449,14 +527,56 @@ class TestValidateGeneratedProject:
 
         assert "Generated file main.py is empty" in str(exc_info.value)
 
+    def test_validate_generated_project_whitespace_file(self, tmp_path):
+        """Test project validation with a whitespace-only essential file."""
+        project_path = tmp_path / "test_project"
+        project_path.mkdir()
+
+        (project_path / "main.py").write_text("  \n\n")
+        (project_path / "pyproject.toml").write_text("Project config")
+
+        with pytest.raises(TemplateError) as exc_info:
+            validate_generated_project(project_path)
+
+        assert "Generated file main.py is empty" in str(exc_info.value)
+
+    def test_validate_generated_project_skips_reading_large_files(self, tmp_path):
+        """Test that large files are validated by size alone."""
+        project_path = tmp_path / "test_project"
+        project_path.mkdir()
+
+        (project_path / "main.py").write_text("from fastapi import FastAPI\n" * 10)
+        (project_path / "pyproject.toml").write_text("[project]\nname = 'x'\n" * 10)
+
+        with patch.object(Path, "read_text") as mock_read_text:
+            validate_generated_project(project_path)
+
+        mock_read_text.assert_not_called()
+
+    def test_validate_generated_project_debug_reads_files(self, tmp_path, monkeypatch):
+        """Test that FASCRAFT_DEBUG=1 reads every essential file."""
+        monkeypatch.setenv("FASCRAFT_DEBUG", "1")
+        project_path = tmp_path / "test_project"
+        project_path.mkdir()
+
+        (project_path / "main.py").write_text(" " * 200)
+        (project_path / "pyproject.toml").write_text("[project]\nname = 'x'\n" * 10)
+
+        with pytest.raises(TemplateError) as exc_info:
+            validate_generated_project(project_path)
+
+        assert "Generated file main.py is empty" in str(exc_info.value)
+
 
 class TestRenderProjectTemplatesWithProgress:
     """Test the render_project_templates_with_progress function."""
 
+    @patch("fascraft.commands.new.PROGRESS_TEMPLATE_THRESHOLD", 0)
+    @patch("fascraft.commands.new.console")
     @patch("fascraft.commands.new.render_single_template")
     @patch("fascraft.commands.new.Progress")
     def test_render_project_templates_with_progress_success(
-        self, mock_progress_class, mock_render_single, tmp_path
+        self, mock_progress_class, mock_render_single, mock_console, tmp_path
     ):
         """Test successful template rendering with progress."""
         # Mock progress bar
@@ -472,10 +592,12 @@ class TestRenderProjectTemplatesWithProgress:
         mock_progress.add_task.assert_called_once()
         assert mock_render_single.call_count == 26  # Number of templates
 
+    @patch("fascraft.commands.new.PROGRESS_TEMPLATE_THRESHOLD", 0)
+    @patch("fascraft.commands.new.console")
     @patch("fascraft.commands.new.render_single_template")
     @patch("fascraft.commands.new.Progress")
     def test_render_project_templates_with_progress_failure(
-        self, mock_progress_class, mock_render_single, tmp_path
+        self, mock_progress_class, mock_render_single, mock_console, tmp_path
     ):
         """Test template rendering failure with progress."""
         # Mock progress bar
@@ -494,39 +616,88 @@ class TestRenderProjectTemplatesWithProgress:
         # Verify progress was stopped
         mock_progress.stop.assert_called_once()
 
+    @patch("fascraft.commands.new.render_single_template")
+    @patch("fascraft.commands.new.Progress")
+    def test_render_project_templates_without_progress(
+        self, mock_progress_class, mock_render_single, tmp_path
+    ):
+        """Test that small template sets render without a progress spinner."""
+        project_path = tmp_path / "test_project"
+        project_name = "test_project"
+
+        render_project_templates_with_progress(project_path, project_name)
+
+        mock_progress_class.assert_not_called()
+        assert mock_render_single.call_count == 26
+
+    @patch("fascraft.commands.new.render_single_template")
+    @patch("fascraft.commands.new.Progress")
+    def test_render_project_templates_without_progress_failure(
+        self, mock_progress_class, mock_render_single, tmp_path
+    ):
+        """Test template rendering failure without a progress spinner."""
+        mock_render_single.side_effect = TemplateError("Template failed")
+
+        with pytest.raises(TemplateRenderError):
+            render_project_templates_with_progress(tmp_path / "p", "p")
+
+        mock_progress_class.assert_not_called()
+
 
 class TestRenderSingleTemplate:
     """Test the render_single_template function."""
 
-    @patch("fascraft.commands.new.Environment")
-    def test_render_single_template_success(self, mock_env_class, tmp_path):
+    @patch("fascraft.commands.new.get_template_environment")
+    def test_render_single_template_success(self, mock_get_env, tmp_path):
         """Test successful single template rendering."""
         # Mock Jinja2 environment
         mock_env = MagicMock()
         mock_template = MagicMock()
         mock_env.get_template.return_value = mock_template
-        mock_template.render.return_value = "Rendered content"
-        mock_env_class.return_value = mock_env
+        mock_template.generate.return_value = iter(["Rendered ", "content"])
+        mock_get_env.return_value = mock_env
 
         project_path = tmp_path / "test_project"
         project_name = "test_project"
 
         render_single_template(project_path, project_name, "main.py.jinja2", "main.py")
 
-        # Verify template was rendered
-        mock_template.render.assert_called_once_with(
+        # Verify template was rendered and streamed to disk
+        mock_template.generate.assert_called_once_with(
             project_name=project_name, author_name="Lutor Iyornumbe"
         )
+        assert (project_path / "main.py").read_text() == "Rendered content"
+
+    @patch("fascraft.commands.new.get_template_environment")
+    def test_render_single_template_failure_keeps_existing_file(
+        self, mock_get_env, tmp_path
+    ):
+        """Test a render failing midway leaves no partial output behind."""
+
+        def failing_chunks(**_):
+            yield "partial "
+            raise RuntimeError("undefined variable")
+
+        mock_get_env.return_value.get_template.return_value.generate = failing_chunks
+        project_path = tmp_path / "test_project"
+        project_path.mkdir()
+        (project_path / "main.py").write_text("original content")
 
-    @patch("fascraft.commands.new.Environment")
-    def test_render_single_template_not_found(self, mock_env_class, tmp_path):
+        with pytest.raises(TemplateRenderError):
+            render_single_template(
+                project_path, "test_project", "main.py.jinja2", "main.py"
+            )
+
+        assert (project_path / "main.py").read_text() == "original content"
+        assert [path.name for path in project_path.iterdir()] == ["main.py"]
+
+    @patch("fascraft.commands.new.get_template_environment")
+    def test_render_single_template_not_found(self, mock_get_env, tmp_path):
         """Test template not found error."""
         # Mock template not found error
         mock_env = MagicMock()
-        mock_env.get_template.side_effect = FileNotFoundError(
-            "No such file or directory"
-        )
-        mock_env_class.return_value = mock_env
+        mock_env.get_template.side_effect = TemplateNotFound("missing.jinja2")
+        mock_get_env.return_value = mock_env
 
         project_path = tmp_path / "test_project"
         project_name = "test_project"
@@ -538,13 +709,15 @@ class TestRenderSingleTemplate:
 
         assert "Template not found" in str(exc_info.value)
 
-    @patch("fascraft.commands.new.Environment")
-    def test_render_single_template_corrupted(self, mock_env_class, tmp_path):
+    @patch("fascraft.commands.new.get_template_environment")
+    def test_render_single_template_corrupted(self, mock_get_env, tmp_path):
         """Test corrupted template error."""
         # Mock template syntax error
         mock_env = MagicMock()
-        mock_env.get_template.side_effect = Exception("Template syntax error")
-        mock_env_class.return_value = mock_env
+        mock_env.get_template.side_effect = TemplateSyntaxError(
+            "Template syntax error", lineno=1
+        )
+        mock_get_env.return_value = mock_env
 
         project_path = tmp_path / "test_project"
         project_name = "test_project"
@@ -555,3 +728,66 @@ class TestRenderSingleTemplate:
             )
 
         assert "Template syntax error" in str(exc_info.value)
+
+
+class TestOpenOutputFile:
+    """Test the open_output_file function."""
+
+    def test_open_output_file_creates_file(self, tmp_path):
+        """Test writing bytes to a new file."""
+        output_path = tmp_path / "main.py"
+
+        with open_output_file(output_path) as output_file:
+            output_file.writelines(["print('héllo')".encode(), b"\n"])
+
+        assert output_path.read_text(encoding="utf-8") == "print('héllo')\n"
+
+    def test_open_output_file_truncates_existing_file(self, tmp_path):
+        """Test that existing content is replaced, not appended to."""
+        output_path = tmp_path / "main.py"
+        output_path.write_bytes(b"a much longer original content")
+
+        with open_output_file(output_path) as output_file:
+            output_file.write(b"short")
+
+        assert output_path.read_bytes() == b"short"
+
+    def test_open_output_file_missing_directory(self, tmp_path):
+        """Test that a missing parent directory raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            open_output_file(tmp_path / "missing" / "main.py")
+
+
+class TestGetBytecodeCache:
+    """Test the get_bytecode_cache function."""
+
+    def test_get_bytecode_cache_uses_xdg_cache_home(self, monkeypatch, tmp_path):
+        """Test that bytecode is cached under XDG_CACHE_HOME when it is set."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        cache = get_bytecode_cache()
+
+        assert cache.directory == str(tmp_path / "fascraft" / "jinja")
+
+    def test_get_bytecode_cache_without_home_directory(self, monkeypatch):
+        """Test that no cache is used when the home directory can't be found."""
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+
+        def no_home():
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.setattr(Path, "home", no_home)
+
+        assert get_bytecode_cache() is None
+
+
+class TestGetTemplateSources:
+    """Test the get_template_sources function."""
+
+    def test_get_template_sources_covers_all_templates(self):
+        """Test that every project template is loaded, including nested ones."""
+        sources = get_template_sources()
+
+        for template_name, _ in ALL_TEMPLATES:
+            assert template_name in sources
+        assert "{{ project_name }}" in sources["config/settings.py.jinja2"]
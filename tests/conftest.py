@@ -1,16 +1,190 @@
 """Pytest configuration and fixtures for FasCraft tests."""
 
+import os
+import shutil
 import tempfile
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
-from typer.testing import CliRunner
+import typer
+
+from fascraft.console import console
+
+if TYPE_CHECKING:
+    from typer.testing import CliRunner
+
+
+class CallRecorder:
+    """Callable stand-in that records the arguments of each call."""
+
+    def __init__(self, wrapped=None) -> None:
+        self.wrapped = wrapped
+        self.calls: list[tuple[tuple, dict]] = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.wrapped is not None:
+            return self.wrapped(*args, **kwargs)
+        return None
+
+
+class StubTemplate:
+    """Jinja2 template stand-in that renders fixed content."""
+
+    __slots__ = ("content", "render_calls")
+
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self.render_calls: list[dict] = []
+
+    def render(self, **context) -> str:
+        self.render_calls.append(context)
+        return self.content
+
+
+class StubEnvironment:
+    """Jinja2 environment stand-in that hands out a single StubTemplate."""
+
+    __slots__ = ("template", "requested")
+
+    def __init__(self, content: str = "ci-cd content") -> None:
+        self.template = StubTemplate(content)
+        self.requested: list[str] = []
+
+    def get_template(self, name: str) -> StubTemplate:
+        self.requested.append(name)
+        return self.template
+
+
+@pytest.fixture(scope="session", autouse=True)
+def template_cache_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Path, None, None]:
+    """Keep compiled template bytecode out of the real user cache dir.
+
+    The shared Jinja2 environments are cached, so they are rebuilt around the
+    session to pick up the temporary bytecode cache directory.
+    """
+    from fascraft.commands import ci_cd, new
+
+    cache_home = tmp_path_factory.mktemp("template-cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("XDG_CACHE_HOME", str(cache_home))
+        new.get_template_environment.cache_clear()
+        ci_cd._make_env.cache_clear()
+        yield new.get_template_cache_dir()
+    new.get_template_environment.cache_clear()
+    ci_cd._make_env.cache_clear()
+
+
+@pytest.fixture
+def project_files() -> Callable[[Path], set[str]]:
+    """Provide a function listing the files under a directory in one walk.
+
+    Paths are relative to the directory and use forward slashes, so tests can
+    compare them against sets of expected paths.
+    """
+
+    def list_files(root: Path) -> set[str]:
+        return {
+            os.path.relpath(os.path.join(dirpath, name), root).replace(os.sep, "/")
+            for dirpath, _, filenames in os.walk(root)
+            for name in filenames
+        }
+
+    return list_files
+
+
+@pytest.fixture
+def assert_contains() -> Callable[..., None]:
+    """Provide a check that every needle occurs in a haystack.
+
+    All missing needles are reported together rather than only the first.
+    """
+
+    def check(haystack: str | bytes, *needles: str | bytes) -> None:
+        missing = [needle for needle in needles if needle not in haystack]
+        assert not missing, f"Missing from content: {missing}"
+
+    return check
 
 
 @pytest.fixture
-def cli_runner() -> CliRunner:
+def assert_exits() -> Callable[..., None]:
+    """Provide a check that a call raises typer.Exit with the given code."""
+
+    def check(code: int, func: Callable[..., object], *args, **kwargs) -> None:
+        try:
+            func(*args, **kwargs)
+        except typer.Exit as exc:
+            assert exc.exit_code == code
+            return
+        pytest.fail(f"{func.__name__} did not raise typer.Exit")
+
+    return check
+
+
+@pytest.fixture
+def stub_environment() -> StubEnvironment:
+    """Provide a lightweight Jinja2 environment stand-in."""
+    return StubEnvironment()
+
+
+@pytest.fixture
+def stub_ci_cd_environment(
+    monkeypatch: pytest.MonkeyPatch, stub_environment: StubEnvironment
+) -> StubEnvironment:
+    """Replace the shared CI/CD Jinja2 environment with a stub."""
+    monkeypatch.setattr("fascraft.commands.ci_cd._make_env", lambda: stub_environment)
+    return stub_environment
+
+
+@pytest.fixture
+def stub_deploy_environment(
+    monkeypatch: pytest.MonkeyPatch, stub_environment: StubEnvironment
+) -> StubEnvironment:
+    """Make the deploy command render with a stub Jinja2 environment."""
+    monkeypatch.setattr(
+        "fascraft.commands.deploy.Environment", lambda **_: stub_environment
+    )
+    return stub_environment
+
+
+@pytest.fixture
+def stub_dockerize_environment(
+    monkeypatch: pytest.MonkeyPatch, stub_environment: StubEnvironment
+) -> StubEnvironment:
+    """Make the dockerize command render with a stub Jinja2 environment."""
+    monkeypatch.setattr(
+        "fascraft.commands.dockerize.Environment", lambda **_: stub_environment
+    )
+    return stub_environment
+
+
+@pytest.fixture
+def console_print(monkeypatch: pytest.MonkeyPatch) -> CallRecorder:
+    """Record calls to the shared console's print instead of rendering them."""
+    recorder = CallRecorder()
+    monkeypatch.setattr(console, "print", recorder)
+    return recorder
+
+
+@pytest.fixture
+def console_print_passthrough(monkeypatch: pytest.MonkeyPatch) -> CallRecorder:
+    """Record calls to the shared console's print and still render them."""
+    recorder = CallRecorder(console.print)
+    monkeypatch.setattr(console, "print", recorder)
+    return recorder
+
+
+@pytest.fixture
+def cli_runner() -> "CliRunner":
     """Provide a CLI runner for testing Typer commands."""
+    # Imported here so runs that never invoke the CLI skip click.testing
+    from typer.testing import CliRunner
+
     return CliRunner()
 
 
@@ -21,6 +195,59 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(temp_dir)
 
 
+@pytest.fixture(scope="session")
+def fastapi_project_skeleton(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build a minimal FastAPI project once per test session."""
+    skeleton = tmp_path_factory.mktemp("fastapi-skeleton")
+    (skeleton / "main.py").write_text("from fastapi import FastAPI\napp = FastAPI()")
+    return skeleton
+
+
+@pytest.fixture
+def fastapi_project(tmp_path: Path, fastapi_project_skeleton: Path) -> Path:
+    """Provide a fresh copy of the minimal FastAPI project for one test."""
+    project_path = tmp_path / "test-project"
+    shutil.copytree(fastapi_project_skeleton, project_path)
+    return project_path
+
+
+@pytest.fixture(scope="session")
+def empty_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide an existing directory without main.py, shared read-only."""
+    return tmp_path_factory.mktemp("not-fastapi")
+
+
+@pytest.fixture
+def nonexistent_project(tmp_path: Path) -> Path:
+    """Provide a project path that is never created."""
+    return tmp_path / "non-existent"
+
+
+@pytest.fixture(scope="session")
+def existing_files_project_skeleton(
+    tmp_path_factory: pytest.TempPathFactory, fastapi_project_skeleton: Path
+) -> Path:
+    """Build a FastAPI project that already has deploy and Docker files, once."""
+    skeleton = tmp_path_factory.mktemp("existing-files-skeleton")
+    shutil.copytree(fastapi_project_skeleton, skeleton, dirs_exist_ok=True)
+    (skeleton / "deploy" / "aws").mkdir(parents=True)
+    (skeleton / "deploy" / "aws" / "ecs-deploy.sh").write_text("# existing")
+    (skeleton / "deploy" / "kubernetes").mkdir()
+    (skeleton / "deploy" / "kubernetes" / "deployment.yaml").write_text("# existing")
+    (skeleton / "Dockerfile").write_text("# existing dockerfile")
+    return skeleton
+
+
+@pytest.fixture
+def existing_files_project(
+    tmp_path: Path, existing_files_project_skeleton: Path
+) -> Path:
+    """Provide a fresh copy of the project with existing deploy and Docker files."""
+    project_path = tmp_path / "test-project"
+    shutil.copytree(existing_files_project_skeleton, project_path)
+    return project_path
+
+
 @pytest.fixture
 def sample_project_name() -> str:
     """Provide a sample project name for testing."""
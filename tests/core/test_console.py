@@ -0,0 +1,15 @@
+"""Tests for the shared console module."""
+
+from fascraft import main
+from fascraft.commands import generate, new
+from fascraft.console import console
+
+
+class TestSharedConsole:
+    """Test that FasCraft output goes through a single console."""
+
+    def test_modules_share_console(self):
+        """Test that the CLI and command modules use the same console."""
+        assert main.console is console
+        assert new.console is console
+        assert generate.console is console
@@ -2,9 +2,11 @@
 
 from unittest.mock import patch
 
+import click
+import typer
 from typer.testing import CliRunner
 
-from fascraft.main import app, hello, version
+from fascraft.main import LAZY_COMMANDS, LAZY_GROUPS, app, hello, version
 
 
 class TestMainCLI:
@@ -76,3 +78,29 @@ class TestMainCLI:
                 version()
                 # Verify console.print was called
                 assert mock_print.called
+
+    def test_lazy_commands_resolve(self):
+        """Test that every lazily registered command can be loaded."""
+        group = typer.main.get_command(app)
+        ctx = click.Context(group)
+        for name in [*LAZY_COMMANDS, *LAZY_GROUPS]:
+            command = group.get_command(ctx, name)
+            assert command is not None
+            assert command.name == name
+
+        # Resolving commands leaves the top-level listing order unchanged
+        assert group.list_commands(ctx) == [
+            *LAZY_COMMANDS,
+            "hello",
+            "version",
+            *LAZY_GROUPS,
+        ]
+
+    def test_lazy_command_help_has_no_completion_options(self):
+        """Test that a lazily loaded command's help matches a regular command."""
+        runner = CliRunner()
+        result = runner.invoke(app, ["new", "--help"])
+        assert result.exit_code == 0
+        assert "--dry-run" in result.stdout
+        assert "--install-completion" not in result.stdout
+        assert "--show-completion" not in result.stdout
@@ -1,22 +1,46 @@
 """Tests for the version module."""
 
+import importlib.metadata
 from unittest.mock import mock_open, patch
 
+import pytest
+
 from fascraft.version import get_version, get_version_info
 
 
 class TestVersionModule:
     """Test the version module functionality."""
 
+    def setup_method(self):
+        """Drop the cached version so each test resolves it afresh."""
+        get_version.cache_clear()
+
+    def teardown_method(self):
+        """Don't leak a version resolved under mocks into other tests."""
+        get_version.cache_clear()
+
     def test_get_version_from_pyproject_toml(self):
         """Test getting version from pyproject.toml."""
         mock_toml_data = {"tool": {"poetry": {"version": "1.2.3"}}}
 
-        with patch("builtins.open", mock_open()):
-            with patch("fascraft.version.tomllib.load", return_value=mock_toml_data):
-                with patch("pathlib.Path.exists", return_value=True):
-                    version = get_version()
-                    assert version == "1.2.3"
+        with patch(
+            "importlib.metadata.version",
+            side_effect=importlib.metadata.PackageNotFoundError("fascraft"),
+        ):
+            with patch("builtins.open", mock_open()):
+                with patch(
+                    "fascraft.version.tomllib.load", return_value=mock_toml_data
+                ):
+                    with patch("pathlib.Path.exists", return_value=True):
+                        version = get_version()
+                        assert version == "1.2.3"
+
+    def test_get_version_is_cached(self):
+        """Test that the version is only resolved once per process."""
+        with patch("importlib.metadata.version", return_value="3.0.0") as mock_meta:
+            assert get_version() == "3.0.0"
+            assert get_version() == "3.0.0"
+            mock_meta.assert_called_once_with("fascraft")
 
     def test_get_version_fallback_to_metadata(self):
         """Test fallback to package metadata when pyproject.toml fails."""
@@ -65,3 +89,13 @@ class TestVersionModule:
                 with patch("importlib.metadata.version", return_value="8.0.0"):
                     version = get_version()
                     assert version == "8.0.0"
+
+    def test_dunder_version_is_lazy(self):
+        """Test that __version__ is resolved through get_version on access."""
+        import fascraft.version as version_module
+
+        with patch("importlib.metadata.version", return_value="9.0.0"):
+            assert version_module.__version__ == "9.0.0"
+
+        with pytest.raises(AttributeError):
+            _ = version_module.not_a_real_attribute
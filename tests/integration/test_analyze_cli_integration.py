@@ -1,6 +1,6 @@
 """Tests for the CLI integration of the enhanced analyze command."""
 
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import fascraft.commands.analyze as analyze_module
 
@@ -47,7 +47,7 @@ class TestAnalyzeCLIIntegration:
                     )
 
                     # Verify documentation analysis was called
-                    mock_doc_analysis.assert_called_once_with(tmp_path)
+                    mock_doc_analysis.assert_called_once_with(tmp_path, ANY)
                     mock_display.assert_called_once()
                     mock_console.assert_called()
 
@@ -82,7 +82,7 @@ class TestAnalyzeCLIIntegration:
                     )
 
                     # Verify version report was called
-                    mock_version_report.assert_called_once_with(tmp_path)
+                    mock_version_report.assert_called_once_with(tmp_path, ANY)
                     mock_display.assert_called_once()
                     mock_console.assert_called()
 
@@ -133,7 +133,7 @@ class TestAnalyzeCLIIntegration:
                     )
 
                     # Verify all analysis functions were called
-                    mock_structure.assert_called_once_with(tmp_path)
+                    mock_structure.assert_called_once_with(tmp_path, ANY)
                     mock_display.assert_called_once()
                     mock_recommend.assert_called_once()
 
@@ -164,5 +164,5 @@ class TestAnalyzeCLIIntegration:
                 )
 
                 # Verify only version report was called
-                mock_version_report.assert_called_once_with(tmp_path)
+                mock_version_report.assert_called_once_with(tmp_path, ANY)
                 mock_doc_analysis.assert_not_called()
@@ -0,0 +1,51 @@
+"""Tests for templates that are copied without Jinja rendering."""
+
+from importlib import resources
+
+from fascraft.commands.new import (
+    ALL_TEMPLATES,
+    STATIC_TEMPLATES,
+    get_template_environment,
+    read_static_template,
+)
+
+JINJA_MARKERS = ("{{", "{%", "{#")
+
+
+def read_source(template_name: str) -> str:
+    """Read a new-project template's source."""
+    return (
+        resources.files("fascraft")
+        .joinpath("templates", "new_project", template_name)
+        .read_text(encoding="utf-8")
+    )
+
+
+class TestStaticTemplates:
+    """Test the STATIC_TEMPLATES fast path."""
+
+    def test_static_templates_match_jinja_free_sources(self):
+        """Test that exactly the templates without Jinja syntax are static."""
+        jinja_free = {
+            template_name
+            for template_name, _ in ALL_TEMPLATES
+            if not any(marker in read_source(template_name) for marker in JINJA_MARKERS)
+        }
+        assert STATIC_TEMPLATES == jinja_free
+
+    def test_static_templates_match_rendered_output(self):
+        """Test that copying a static template gives the same bytes as rendering."""
+        env = get_template_environment()
+        for template_name in STATIC_TEMPLATES:
+            rendered = env.get_template(template_name).render(
+                project_name="demo", author_name="Lutor Iyornumbe"
+            )
+            assert read_static_template(template_name) == rendered.encode("utf-8")
+
+    def test_template_bytecode_cached_in_cache_dir(self, template_cache_dir):
+        """Test compiled templates go to the configured bytecode cache dir."""
+        env = get_template_environment()
+        env.get_template(next(iter(STATIC_TEMPLATES)))
+
+        assert env.bytecode_cache.directory == str(template_cache_dir)
+        assert any(template_cache_dir.glob("*.cache"))